@@ -0,0 +1,759 @@
+import heapq
+from array import array
+from collections import deque
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple
+import tree_snapshot
+
+
+NIL = -1  # 자식/루트가 없음을 나타내는 인덱스
+
+
+class ArrayBinaryTree:
+    def __init__(self):
+        """
+        노드 객체 대신 병렬 배열로 표현한 이진 탐색 트리를 초기화한다.
+
+        i번 슬롯의 노드는 다음 배열들의 i번째 원소로 표현된다.
+        - keys[i], data[i]: 노드의 키와 데이터 (파이썬 리스트)
+        - left[i], right[i]: 자식 노드의 슬롯 번호, 없으면 NIL (정수 배열)
+        - count[i], height[i]: 서브트리의 노드 수와 높이 (정수 배열)
+
+        노드마다 파이썬 객체와 __dict__를 만들지 않으므로 노드당 메모리가
+        binary_tree.BinaryTree보다 훨씬 작다. 삭제된 슬롯은 right 배열로 이어진
+        빈 슬롯 리스트(free list)에 보관했다가 다음 삽입 때 재사용한다.
+
+        공개 메서드는 binary_tree.BinaryTree와 같다. 다만 트리마다 자기 배열을 가지므로
+        split/join은 노드를 옮겨 붙이지 못하고 from_sorted로 다시 만들어 O(n)이다.
+        """
+        self._clear()
+
+    def _clear(self) -> None:
+        """
+        모든 슬롯을 버리고 빈 트리로 되돌린다.
+        """
+        self.keys: List[Any] = []
+        self.data: List[Any] = []
+        self.left = array("q")
+        self.right = array("q")
+        self.count = array("q")
+        self.height = array("q")
+        self.root: int = NIL
+        self.free: int = NIL  # 빈 슬롯 리스트의 첫 슬롯
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[Any, Any]]) -> "ArrayBinaryTree":
+        """
+        키 오름차순으로 정렬된 (key, data) 쌍들로 완전 균형 트리를 O(n)에 만든다.
+
+        i번째 쌍을 그대로 i번 슬롯에 두고, 자식 인덱스만 계산해 채운다.
+
+        Args:
+            items (Iterable[tuple]): 키 오름차순의 (key, data) 쌍
+
+        Returns:
+            ArrayBinaryTree: 만들어진 트리
+
+        Raises:
+            KeyError: 같은 키가 두 번 나오면 발생
+            ValueError: 키가 오름차순이 아니면 발생
+        """
+        tree = cls()
+        pairs = list(items)
+        n = len(pairs)
+
+        for i in range(1, n):
+            prev_key, key = pairs[i - 1][0], pairs[i][0]
+            if not (prev_key < key):
+                if not (key < prev_key):
+                    raise KeyError(key)
+                raise ValueError("items must be sorted by key")
+
+        tree.keys = [pair[0] for pair in pairs]
+        tree.data = [pair[1] for pair in pairs]
+        tree.left = array("q", [NIL]) * n
+        tree.right = array("q", [NIL]) * n
+        tree.count = array("q", [1]) * n
+        tree.height = array("q", [1]) * n
+        tree.root = tree._build(0, n)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[Tuple[Any, Any]]) -> "ArrayBinaryTree":
+        """
+        임의 순서의 (key, data) 쌍들을 키로 정렬한 뒤 from_sorted로 한 번에 만든다.
+
+        Args:
+            items (Iterable[tuple]): (key, data) 쌍
+
+        Returns:
+            ArrayBinaryTree: 만들어진 트리
+
+        Raises:
+            KeyError: 같은 키가 두 번 나오면 발생
+        """
+        return cls.from_sorted(sorted(items, key=itemgetter(0)))
+
+    def _build(self, lo: int, hi: int) -> int:
+        """
+        정렬된 슬롯 [lo, hi)를 완전 균형 서브트리로 연결하고 루트 슬롯을 반환한다.
+
+        Args:
+            lo (int): 시작 슬롯(포함)
+            hi (int): 끝 슬롯(미포함)
+
+        Returns:
+            int: 서브트리 루트의 슬롯 번호, 비어있으면 NIL
+        """
+        if lo >= hi:
+            return NIL
+
+        mid = (lo + hi) // 2
+        self.left[mid] = self._build(lo, mid)
+        self.right[mid] = self._build(mid + 1, hi)
+        self._update(mid)
+        return mid
+
+    def _count(self, i: int) -> int:
+        """
+        i번 슬롯을 루트로 하는 서브트리의 노드 수를 반환한다. NIL이면 0이다.
+
+        Args:
+            i (int): 슬롯 번호 또는 NIL
+
+        Returns:
+            int: 서브트리의 노드 수
+        """
+        return self.count[i] if i != NIL else 0
+
+    def _height(self, i: int) -> int:
+        """
+        i번 슬롯을 루트로 하는 서브트리의 높이를 반환한다. NIL이면 0이다.
+
+        Args:
+            i (int): 슬롯 번호 또는 NIL
+
+        Returns:
+            int: 서브트리의 높이
+        """
+        return self.height[i] if i != NIL else 0
+
+    def _update(self, i: int) -> None:
+        """
+        자식들의 값을 이용해 i번 슬롯의 노드 수와 높이를 다시 계산한다.
+
+        Args:
+            i (int): 갱신할 슬롯 번호
+        """
+        l, r = self.left[i], self.right[i]
+        self.count[i] = 1 + self._count(l) + self._count(r)
+        self.height[i] = 1 + max(self._height(l), self._height(r))
+
+    def _alloc(self, key, data) -> int:
+        """
+        새 노드를 위한 슬롯을 할당한다. 빈 슬롯이 있으면 재사용한다.
+
+        Args:
+            key (Any): 노드의 키
+            data (Any): 노드의 데이터
+
+        Returns:
+            int: 할당된 슬롯 번호
+        """
+        if self.free != NIL:
+            i = self.free
+            self.free = self.right[i]
+            self.keys[i] = key
+            self.data[i] = data
+            self.left[i] = NIL
+            self.right[i] = NIL
+            self.count[i] = 1
+            self.height[i] = 1
+            return i
+
+        self.keys.append(key)
+        self.data.append(data)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.count.append(1)
+        self.height.append(1)
+        return len(self.keys) - 1
+
+    def _release(self, i: int) -> None:
+        """
+        i번 슬롯을 비우고 빈 슬롯 리스트의 맨 앞에 넣는다.
+
+        Args:
+            i (int): 해제할 슬롯 번호
+        """
+        self.keys[i] = None
+        self.data[i] = None
+        self.left[i] = NIL
+        self.right[i] = self.free
+        self.free = i
+
+    def _find(self, key) -> int:
+        """
+        key를 가진 노드의 슬롯 번호를 찾는다.
+
+        Args:
+            key (Any): 찾을 키
+
+        Returns:
+            int: 슬롯 번호, 없으면 NIL
+        """
+        keys, left, right = self.keys, self.left, self.right
+        i = self.root
+
+        while i != NIL:
+            k = keys[i]
+            if key < k:
+                i = left[i]
+            elif key > k:
+                i = right[i]
+            else:
+                return i
+
+        return NIL
+
+    @classmethod
+    def join(cls, left: "ArrayBinaryTree", right: "ArrayBinaryTree") -> "ArrayBinaryTree":
+        """
+        모든 키가 left < right 인 두 트리를 하나로 합친다.
+
+        트리마다 자기 배열을 가지므로 binary_tree.BinaryTree처럼 노드를 옮겨 붙일 수
+        없다. 두 트리를 순서대로 이어 from_sorted로 다시 만들므로 O(n + m)이다.
+        결과 트리로 옮겨진 left와 right는 빈 트리가 된다.
+
+        Args:
+            left (ArrayBinaryTree): 작은 키들의 트리
+            right (ArrayBinaryTree): 큰 키들의 트리
+
+        Returns:
+            ArrayBinaryTree: 합쳐진 트리 (호출한 클래스의 인스턴스)
+
+        Raises:
+            ValueError: left의 최대 키가 right의 최소 키보다 작지 않으면 발생
+        """
+        n = left.size()
+        if n and right.size() and not (left.select(n - 1) < right.select(0)):
+            raise ValueError("keys of left must all be smaller than keys of right")
+
+        tree = cls.from_sorted(chain(left.range(), right.range()))
+        left._clear()
+        right._clear()
+        return tree
+
+    @classmethod
+    def merge(cls, a: "ArrayBinaryTree", b: "ArrayBinaryTree") -> "ArrayBinaryTree":
+        """
+        키 범위가 겹칠 수 있는 두 트리를 합친 새 완전 균형 트리를 O(n + m)에 만든다.
+
+        두 트리를 동시에 중위 순회하며 정렬된 (key, data) 쌍으로 병합한 뒤
+        from_sorted로 한 번에 만든다. a와 b는 바뀌지 않는다.
+
+        Args:
+            a (ArrayBinaryTree): 합칠 트리
+            b (ArrayBinaryTree): 합칠 트리
+
+        Returns:
+            ArrayBinaryTree: 합쳐진 트리 (호출한 클래스의 인스턴스)
+
+        Raises:
+            KeyError: 두 트리에 같은 키가 있으면 발생
+        """
+        return cls.from_sorted(heapq.merge(a.range(), b.range(), key=itemgetter(0)))
+
+    def split(self, key) -> Tuple["ArrayBinaryTree", "ArrayBinaryTree"]:
+        """
+        트리를 key 미만의 키들과 key 이상의 키들로 이루어진 두 트리로 나눈다.
+
+        두 결과 트리는 각자 새 배열에 from_sorted로 만들어지므로 O(n)이다.
+        이 트리는 빈 트리가 된다.
+
+        Args:
+            key (Any): 기준 키 (트리에 없어도 된다)
+
+        Returns:
+            tuple: (key 미만 트리, key 이상 트리) - 이 트리와 같은 클래스의 인스턴스
+        """
+        cls = type(self)
+        left = cls.from_sorted(self.range(None, key))
+        right = cls.from_sorted(self.range(key, None))
+        self._clear()
+        return left, right
+
+    @staticmethod
+    def open(path: str) -> tree_snapshot.MappedBinaryTree:
+        """
+        save로 저장한 스냅샷 파일을 메모리 매핑하여 읽기 전용 트리로 연다.
+
+        binary_tree.BinaryTree.save로 저장한 파일도 같은 형식이므로 열 수 있다.
+
+        Args:
+            path (str): 스냅샷 파일 경로
+
+        Returns:
+            MappedBinaryTree: 메모리 매핑된 읽기 전용 트리
+        """
+        return tree_snapshot.MappedBinaryTree(path)
+
+    def save(self, path: str) -> None:
+        """
+        트리를 binary_tree.BinaryTree.save와 같은 형식의 스냅샷 파일로 저장한다.
+
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        tree_snapshot.save_array(self, path)
+
+    def size(self) -> int:
+        """
+        트리의 전체 노드 개수를 반환한다.
+
+        Returns:
+            int: 트리의 노드 수
+        """
+        return self._count(self.root)
+
+    def depth(self) -> int:
+        """
+        트리의 깊이(높이)를 반환한다.
+
+        Returns:
+            int: 트리의 깊이
+        """
+        return self._height(self.root)
+
+    def nbytes(self) -> int:
+        """
+        트리 구조(병렬 배열과 리스트)가 차지하는 바이트 수를 반환한다.
+
+        키/데이터 객체 자체의 크기는 포함하지 않는다.
+
+        Returns:
+            int: 구조가 차지하는 바이트 수
+        """
+        return (
+            self.keys.__sizeof__()
+            + self.data.__sizeof__()
+            + self.left.__sizeof__()
+            + self.right.__sizeof__()
+            + self.count.__sizeof__()
+            + self.height.__sizeof__()
+        )
+
+    def inorder(self) -> List[Any]:
+        """
+        트리의 중위 순회 결과를 리스트로 반환한다.
+
+        Returns:
+            list: 중위 순회 결과(노드 데이터의 리스트)
+        """
+        return list(self.iter_inorder())
+
+    def preorder(self) -> List[Any]:
+        """
+        트리의 전위 순회 결과를 리스트로 반환한다.
+
+        Returns:
+            list: 전위 순회 결과(노드 데이터의 리스트)
+        """
+        return list(self.iter_preorder())
+
+    def postorder(self) -> List[Any]:
+        """
+        트리의 후위 순회 결과를 리스트로 반환한다.
+
+        Returns:
+            list: 후위 순회 결과(노드 데이터의 리스트)
+        """
+        return list(self.iter_postorder())
+
+    def iter_inorder(self) -> Iterator[Any]:
+        """
+        트리를 중위 순회하며 노드 데이터를 하나씩 내보낸다.
+
+        Yields:
+            Any: 중위 순회 순서의 노드 데이터
+        """
+        left, right, data = self.left, self.right, self.data
+        stack: List[int] = []
+        i = self.root
+
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+
+            i = stack.pop()
+            yield data[i]
+            i = right[i]
+
+    def iter_preorder(self) -> Iterator[Any]:
+        """
+        트리를 전위 순회하며 노드 데이터를 하나씩 내보낸다.
+
+        Yields:
+            Any: 전위 순회 순서의 노드 데이터
+        """
+        left, right, data = self.left, self.right, self.data
+        stack: List[int] = [self.root] if self.root != NIL else []
+
+        while stack:
+            i = stack.pop()
+            yield data[i]
+
+            if right[i] != NIL:
+                stack.append(right[i])
+            if left[i] != NIL:
+                stack.append(left[i])
+
+    def iter_postorder(self) -> Iterator[Any]:
+        """
+        트리를 후위 순회하며 노드 데이터를 하나씩 내보낸다.
+
+        Yields:
+            Any: 후위 순회 순서의 노드 데이터
+        """
+        left, right, data = self.left, self.right, self.data
+        stack: List[int] = []
+        i = self.root
+        last = NIL
+
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+
+            top = stack[-1]
+            if right[top] != NIL and right[top] != last:
+                i = right[top]
+            else:
+                last = stack.pop()
+                yield data[last]
+
+    def iter_levels(self, max_depth: Optional[int] = None) -> Iterator[Any]:
+        """
+        트리를 넓이 우선(레벨 순서)으로 순회하며 노드 데이터를 하나씩 내보낸다.
+
+        Args:
+            max_depth (int or None): 내려갈 최대 깊이 (루트만이면 1).
+                                     None이면 트리 전체를 순회한다.
+
+        Yields:
+            Any: 넓이 우선 순회 순서의 노드 데이터
+        """
+        data = self.data
+        for level in self._iter_levels(max_depth):
+            for i in level:
+                yield data[i]
+
+    def iter_level_batches(self, max_depth: Optional[int] = None) -> Iterator[List[Any]]:
+        """
+        트리를 레벨 단위로 순회하며 한 레벨의 노드 데이터를 리스트로 묶어 내보낸다.
+
+        Args:
+            max_depth (int or None): 내려갈 최대 깊이 (루트만이면 1).
+                                     None이면 트리 전체를 순회한다.
+
+        Yields:
+            list: 한 레벨에 있는 노드 데이터의 리스트 (왼쪽부터)
+        """
+        data = self.data
+        for level in self._iter_levels(max_depth):
+            yield [data[i] for i in level]
+
+    def _iter_levels(self, max_depth: Optional[int] = None) -> Iterator[Deque[int]]:
+        """
+        레벨 단위로 넓이 우선 순회하며 한 레벨의 슬롯 번호들을 deque로 내보낸다.
+
+        내보낸 deque는 다음 레벨에 재사용되므로 다음 레벨을 요청하기 전에 사용을 마쳐야 한다.
+
+        Args:
+            max_depth (int or None): 내려갈 최대 깊이. None이면 끝까지 내려간다.
+
+        Yields:
+            deque: 한 레벨에 있는 슬롯 번호들 (왼쪽부터)
+        """
+        if self.root == NIL or (max_depth is not None and max_depth < 1):
+            return
+
+        left, right = self.left, self.right
+        queue: Deque[int] = deque([self.root])
+        level = 1
+
+        while queue:
+            yield queue
+
+            if max_depth is not None and level >= max_depth:
+                return
+
+            for _ in range(len(queue)):
+                i = queue.popleft()
+
+                if left[i] != NIL:
+                    queue.append(left[i])
+
+                if right[i] != NIL:
+                    queue.append(right[i])
+
+            level += 1
+
+    def bft(self, max_depth: Optional[int] = None) -> List[Any]:
+        """
+        트리의 넓이 우선 순회(Breath-First Traversal) 결과를 리스트로 반환한다.
+
+        Args:
+            max_depth (int or None): 내려갈 최대 깊이 (루트만이면 1).
+                                     None이면 트리 전체를 순회한다.
+
+        Returns:
+            list: 넓이 우선 순회 결과(노드 데이터의 리스트)
+        """
+        return list(self.iter_levels(max_depth))
+
+    def insert(self, key, data) -> None:
+        """
+        트리에 새로운 값을 삽입하고, 삽입 경로의 노드 수/높이를 갱신한다.
+
+        Args:
+           key (Any): 삽입할 노드의 키 값 (비교 기준)
+           data (Any): 키에 대응되는 데이터
+
+        Raises:
+            KeyError: 같은 키가 이미 존재하면 발생
+        """
+        if self.root == NIL:
+            self.root = self._alloc(key, data)
+            return
+
+        path: List[int] = []
+        i = self.root
+
+        while True:
+            path.append(i)
+            k = self.keys[i]
+
+            if key < k:
+                if self.left[i] == NIL:
+                    self.left[i] = self._alloc(key, data)
+                    break
+                i = self.left[i]
+
+            elif key > k:
+                if self.right[i] == NIL:
+                    self.right[i] = self._alloc(key, data)
+                    break
+                i = self.right[i]
+
+            else:
+                raise KeyError(key)
+
+        for i in reversed(path):
+            self._update(i)
+
+    def get(self, key) -> Optional[Any]:
+        """
+        key에 대응되는 데이터를 반환한다.
+
+        Args:
+            key (Any): 찾을 키
+
+        Returns:
+            Any or None: key에 대응되는 데이터, key가 없으면 None
+        """
+        i = self._find(key)
+        return self.data[i] if i != NIL else None
+
+    def delete(self, key) -> Any:
+        """
+        key를 가진 노드를 제거하고 그 데이터를 반환한다. 비워진 슬롯은 재사용된다.
+
+        Args:
+            key (Any): 제거할 키
+
+        Returns:
+            Any: 제거된 노드의 데이터
+
+        Raises:
+            KeyError: key가 트리에 없으면 발생
+        """
+        path: List[int] = []
+        i = self.root
+
+        while i != NIL and key != self.keys[i]:
+            path.append(i)
+            i = self.left[i] if key < self.keys[i] else self.right[i]
+
+        if i == NIL:
+            raise KeyError(key)
+
+        data = self.data[i]
+
+        if self.left[i] != NIL and self.right[i] != NIL:
+            # 후속자의 키/데이터를 i로 옮기고, 대신 후속자 슬롯을 제거한다.
+            path.append(i)
+            successor = self.right[i]
+            while self.left[successor] != NIL:
+                path.append(successor)
+                successor = self.left[successor]
+
+            self.keys[i] = self.keys[successor]
+            self.data[i] = self.data[successor]
+            i = successor
+
+        child = self.left[i] if self.left[i] != NIL else self.right[i]
+
+        if not path:
+            self.root = child
+        elif self.left[path[-1]] == i:
+            self.left[path[-1]] = child
+        else:
+            self.right[path[-1]] = child
+
+        self._release(i)
+
+        for j in reversed(path):
+            self._update(j)
+
+        return data
+
+    def floor(self, key) -> Optional[Any]:
+        """
+        key 이하인 키 중 가장 큰 키를 반환한다.
+
+        Args:
+            key (Any): 기준 키 (트리에 없어도 된다)
+
+        Returns:
+            Any or None: key 이하의 최대 키, 없으면 None
+        """
+        result = None
+        i = self.root
+
+        while i != NIL:
+            k = self.keys[i]
+            if key < k:
+                i = self.left[i]
+            elif key > k:
+                result = k
+                i = self.right[i]
+            else:
+                return k
+
+        return result
+
+    def ceiling(self, key) -> Optional[Any]:
+        """
+        key 이상인 키 중 가장 작은 키를 반환한다.
+
+        Args:
+            key (Any): 기준 키 (트리에 없어도 된다)
+
+        Returns:
+            Any or None: key 이상의 최소 키, 없으면 None
+        """
+        result = None
+        i = self.root
+
+        while i != NIL:
+            k = self.keys[i]
+            if key > k:
+                i = self.right[i]
+            elif key < k:
+                result = k
+                i = self.left[i]
+            else:
+                return k
+
+        return result
+
+    def range(self, lo=None, hi=None) -> Iterator[Tuple[Any, Any]]:
+        """
+        lo <= key < hi 를 만족하는 (key, data) 쌍을 키 순서대로 내보낸다.
+
+        Args:
+            lo (Any or None): 하한(포함). None이면 하한이 없다.
+            hi (Any or None): 상한(미포함). None이면 상한이 없다.
+
+        Yields:
+            tuple: (key, data)
+        """
+        keys, left, right = self.keys, self.left, self.right
+        stack: List[int] = []
+        i = self.root
+
+        while stack or i != NIL:
+            while i != NIL:
+                if lo is not None and keys[i] < lo:
+                    i = right[i]
+                else:
+                    stack.append(i)
+                    i = left[i]
+
+            if not stack:
+                return
+
+            i = stack.pop()
+            if hi is not None and not (keys[i] < hi):
+                return
+
+            yield keys[i], self.data[i]
+            i = right[i]
+
+    def select(self, k: int) -> Any:
+        """
+        k번째로 작은 키를 반환한다. (k는 0부터 시작)
+
+        Args:
+            k (int): 찾을 순위 (0 이상 size() 미만)
+
+        Returns:
+            Any: k번째로 작은 키
+
+        Raises:
+            IndexError: k가 범위를 벗어나면 발생
+        """
+        if k < 0 or k >= self.size():
+            raise IndexError("select index out of range")
+
+        i = self.root
+        while i != NIL:
+            left_count = self._count(self.left[i])
+
+            if k < left_count:
+                i = self.left[i]
+            elif k > left_count:
+                k -= left_count + 1
+                i = self.right[i]
+            else:
+                return self.keys[i]
+
+        raise RuntimeError("Tree is corrupted: subtree counts are inconsistent")
+
+    def rank(self, key) -> int:
+        """
+        트리에서 key보다 작은 키의 개수를 반환한다.
+
+        Args:
+            key (Any): 순위를 구할 키 (트리에 없어도 된다)
+
+        Returns:
+            int: key보다 작은 키의 개수
+        """
+        result = 0
+        i = self.root
+
+        while i != NIL:
+            k = self.keys[i]
+            if key < k:
+                i = self.left[i]
+            elif key > k:
+                result += self._count(self.left[i]) + 1
+                i = self.right[i]
+            else:
+                return result + self._count(self.left[i])
+
+        return result
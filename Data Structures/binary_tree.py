@@ -1,4 +1,12 @@
-from typing import Any, List, Optional
+import threading
+from collections import deque
+from operator import itemgetter
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar
+
+import tree_snapshot
+
+
+T = TypeVar("T", bound="BinaryTree")
 
 
 class Node:
@@ -7,23 +15,27 @@ class Node:
         이진 트리를 구성하는 노드를 초기화한다.
 
         Args:
+            key (Any): 노드의 키 값 (비교 기준)
             item (Any): 노드에 저장할 데이터
         """
         self.key = key
         self.data = item
         self.left: Optional["Node"] = None
         self.right: Optional["Node"] = None
+        self.count: int = 1   # 이 노드를 루트로 하는 서브트리의 노드 수
+        self.height: int = 1  # 이 노드를 루트로 하는 서브트리의 높이
 
     def size(self) -> int:
         """
         현재 노드를 루트로 하는 (서브)트리의 노드 개수를 반환한다.
 
+        left/right를 직접 연결한 노드도 올바르게 세도록 저장된 count를 쓰지 않고
+        명시적 스택으로 실제 노드를 센다. (O(n), 트리 안에서는 BinaryTree.size()가 O(1))
+
         Returns:
             int: (서브)트리의 전체 노드 수
         """
-        l = self.left.size() if self.left else 0
-        r = self.right.size() if self.right else 0
-        return l + r + 1
+        return sum(1 for _ in _iter_preorder(self))
 
     def depth(self) -> int:
         """
@@ -34,12 +46,13 @@ class Node:
             - 노드가 하나만 있는 트리의 깊이는 1
             - 그 외에는 1 + max(왼쪽 깊이, 오른쪽 깊이)
 
+        left/right를 직접 연결한 노드도 올바르게 재도록 저장된 height를 쓰지 않고
+        레벨 단위 순회로 실제 레벨 수를 센다. (O(n), 트리 안에서는 BinaryTree.depth()가 O(1))
+
         Returns:
             int: (서브)트리의 깊이
         """
-        left_depth = self.left.depth() if self.left else 0
-        right_depth = self.right.depth() if self.right else 0
-        return 1 + max(left_depth, right_depth)
+        return sum(1 for _ in _iter_levels(self))
 
     def inorder(self) -> List[Any]:
         """
@@ -51,17 +64,7 @@ class Node:
         Returns:
             list: 중위 순회 결과(노드 데이터의 리스트)
         """
-        traversal: List[Any] = []
-
-        if self.left:
-            traversal += self.left.inorder()
-
-        traversal.append(self.data)
-
-        if self.right:
-            traversal += self.right.inorder()
-
-        return traversal
+        return [node.data for node in _iter_inorder(self)]
 
     def preorder(self) -> List[Any]:
         """
@@ -73,15 +76,7 @@ class Node:
         Returns:
             list: 전위 순회 결과(노드 데이터의 리스트)
         """
-        traversal: List[Any] = [self.data]
-
-        if self.left:
-            traversal += self.left.preorder()
-
-        if self.right:
-            traversal += self.right.preorder()
-
-        return traversal
+        return [node.data for node in _iter_preorder(self)]
 
     def postorder(self) -> List[Any]:
         """
@@ -93,17 +88,7 @@ class Node:
         Returns:
             list: 후위 순회 결과(노드 데이터의 리스트)
         """
-        traversal: List[Any] = []
-
-        if self.left:
-            traversal += self.left.postorder()
-
-        if self.right:
-            traversal += self.right.postorder()
-
-        traversal.append(self.data)
-
-        return traversal
+        return [node.data for node in _iter_postorder(self)]
 
     def insert(self, key, data) -> None:
         """
@@ -116,33 +101,711 @@ class Node:
         Returns:
             None
         """
-        if key < self.key:
-            if self.left:
-                self.left.insert(key, data)
-            else:
-                self.left = Node(key, data)
+        path: List[Node] = []
+        curr: Node = self
+
+        # 재귀 대신 반복문으로 내려가며 지나온 경로를 기억한다.
+        while True:
+            path.append(curr)
+
+            if key < curr.key:
+                if curr.left is None:
+                    curr.left = Node(key, data)
+                    break
+                curr = curr.left
+
+            elif key > curr.key:
+                if curr.right is None:
+                    curr.right = Node(key, data)
+                    break
+                curr = curr.right
 
-        elif key > self.key:
-            if self.right:
-                self.right.insert(key, data)
             else:
-                self.right = Node(key, data)
-        
+                raise KeyError(key)
+
+        # 새 노드가 붙은 경로를 거슬러 올라가며 노드 수/높이를 갱신한다.
+        for node in reversed(path):
+            _update(node)
+
+
+def _iter_inorder(root: Optional[Node]) -> Iterator[Node]:
+    """
+    명시적 스택으로 중위 순회(left -> self -> right)하며 노드를 하나씩 내보낸다.
+
+    재귀를 사용하지 않으므로 트리가 깊어도 RecursionError가 발생하지 않고,
+    스택에는 현재 노드의 조상 중 아직 방문하지 않은 것만 남는다.
+
+    Args:
+        root (Node or None): 순회를 시작할 서브트리의 루트
+
+    Yields:
+        Node: 중위 순회 순서의 노드
+    """
+    stack: List[Node] = []
+    curr = root
+
+    while stack or curr:
+        while curr:
+            stack.append(curr)
+            curr = curr.left
+
+        curr = stack.pop()
+        yield curr
+        curr = curr.right
+
+
+def _iter_preorder(root: Optional[Node]) -> Iterator[Node]:
+    """
+    명시적 스택으로 전위 순회(self -> left -> right)하며 노드를 하나씩 내보낸다.
+
+    Args:
+        root (Node or None): 순회를 시작할 서브트리의 루트
+
+    Yields:
+        Node: 전위 순회 순서의 노드
+    """
+    stack: List[Node] = [root] if root else []
+
+    while stack:
+        curr = stack.pop()
+        yield curr
+
+        # 왼쪽을 먼저 방문해야 하므로 오른쪽을 먼저 쌓는다.
+        if curr.right:
+            stack.append(curr.right)
+        if curr.left:
+            stack.append(curr.left)
+
+
+def _iter_postorder(root: Optional[Node]) -> Iterator[Node]:
+    """
+    명시적 스택으로 후위 순회(left -> right -> self)하며 노드를 하나씩 내보낸다.
+
+    직전에 내보낸 노드(last)를 기억해, 오른쪽 서브트리를 이미 끝냈는지 판단한다.
+
+    Args:
+        root (Node or None): 순회를 시작할 서브트리의 루트
+
+    Yields:
+        Node: 후위 순회 순서의 노드
+    """
+    stack: List[Node] = []
+    curr = root
+    last: Optional[Node] = None
+
+    while stack or curr:
+        while curr:
+            stack.append(curr)
+            curr = curr.left
+
+        top = stack[-1]
+        if top.right and top.right is not last:
+            curr = top.right
         else:
-            raise KeyError(key)
+            last = stack.pop()
+            yield last
+
+
+def _iter_levels(root: Optional[Node], max_depth: Optional[int] = None) -> Iterator[Deque[Node]]:
+    """
+    레벨 단위로 넓이 우선 순회하며 한 레벨의 노드들을 deque로 내보낸다.
+
+    deque 하나를 큐로 쓰고, 한 레벨을 내보낸 뒤 그 레벨의 노드들을 꺼내며
+    다음 레벨의 자식들을 넣는다. 각 노드는 한 번씩만 넣고 꺼내므로 전체 O(n)이다.
+    내보낸 deque는 다음 레벨에 재사용되므로 다음 레벨을 요청하기 전에 사용을 마쳐야 한다.
+
+    Args:
+        root (Node or None): 순회를 시작할 서브트리의 루트
+        max_depth (int or None): 내려갈 최대 깊이 (루트만이면 1). None이면 끝까지 내려간다.
+
+    Yields:
+        deque: 한 레벨에 있는 노드들 (왼쪽부터)
+    """
+    if not root or (max_depth is not None and max_depth < 1):
+        return
+
+    queue: Deque[Node] = deque([root])
+    level = 1
+
+    while queue:
+        yield queue
+
+        if max_depth is not None and level >= max_depth:
+            return
+
+        for _ in range(len(queue)):
+            current = queue.popleft()
+
+            if current.left:
+                queue.append(current.left)
+
+            if current.right:
+                queue.append(current.right)
+
+        level += 1
+
+
+def _find(root: Optional[Node], key) -> Optional[Node]:
+    """
+    root를 루트로 하는 이진 탐색 트리에서 key를 가진 노드를 찾는다.
+
+    Args:
+        root (Node or None): 탐색을 시작할 서브트리의 루트
+        key (Any): 찾을 키
+
+    Returns:
+        Node or None: key를 가진 노드, 없으면 None
+    """
+    curr = root
+
+    while curr:
+        if key < curr.key:
+            curr = curr.left
+        elif key > curr.key:
+            curr = curr.right
+        else:
+            return curr
+
+    return None
+
+
+def _height(node: Optional[Node]) -> int:
+    """
+    서브트리의 높이를 반환한다. 빈 서브트리(None)의 높이는 0이다.
+
+    Args:
+        node (Node or None): 서브트리의 루트
+
+    Returns:
+        int: 서브트리의 높이
+    """
+    return node.height if node else 0
+
+
+def _count(node: Optional[Node]) -> int:
+    """
+    서브트리의 노드 수를 반환한다. 빈 서브트리(None)의 노드 수는 0이다.
+
+    Args:
+        node (Node or None): 서브트리의 루트
+
+    Returns:
+        int: 서브트리의 노드 수
+    """
+    return node.count if node else 0
+
+
+def _update(node: Node) -> None:
+    """
+    자식들의 값을 이용해 node의 노드 수(count)와 높이(height)를 다시 계산한다.
+
+    Args:
+        node (Node): 갱신할 노드
+    """
+    node.count = 1 + _count(node.left) + _count(node.right)
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+
+def _copy(node: Node) -> Node:
+    """
+    node의 키/데이터/자식 링크/노드 수/높이를 그대로 가진 새 노드를 만든다.
+
+    경로 복사(path copying)에서, 다른 스냅샷이 공유하고 있을 수 있는 노드를
+    수정하기 전에 사본을 만들 때 사용한다.
+
+    Args:
+        node (Node): 복사할 노드
+
+    Returns:
+        Node: 새로 만든 사본
+    """
+    clone = Node(node.key, node.data)
+    clone.left = node.left
+    clone.right = node.right
+    clone.count = node.count
+    clone.height = node.height
+    return clone
+
+
+def _rotate_right(node: Node, copy: bool = False) -> Node:
+    """
+    node를 기준으로 오른쪽 회전을 수행하고 새 서브트리 루트를 반환한다.
+
+    node의 왼쪽 자식 l이 새 루트가 되고, l의 오른쪽 서브트리는 node의 왼쪽으로 옮겨진다.
+
+    Args:
+        node (Node): 회전의 기준 노드 (왼쪽 자식이 있어야 함)
+        copy (bool): True이면 l을 수정하기 전에 복사한다. (node는 호출자가 이미
+                     복사했다고 가정한다)
+
+    Returns:
+        Node: 회전 후 서브트리의 루트
+    """
+    l = node.left
+    assert l is not None
+    if copy:
+        l = _copy(l)
+    node.left = l.right
+    l.right = node
+    _update(node)
+    _update(l)
+    return l
+
+
+def _rotate_left(node: Node, copy: bool = False) -> Node:
+    """
+    node를 기준으로 왼쪽 회전을 수행하고 새 서브트리 루트를 반환한다.
+
+    Args:
+        node (Node): 회전의 기준 노드 (오른쪽 자식이 있어야 함)
+        copy (bool): True이면 r을 수정하기 전에 복사한다.
+
+    Returns:
+        Node: 회전 후 서브트리의 루트
+    """
+    r = node.right
+    assert r is not None
+    if copy:
+        r = _copy(r)
+    node.right = r.left
+    r.left = node
+    _update(node)
+    _update(r)
+    return r
+
+
+def _rebalance(node: Node, copy: bool = False) -> Node:
+    """
+    AVL 균형 조건(좌우 높이 차이 1 이하)이 깨졌으면 회전으로 복구한다.
+
+    - 왼쪽이 2 이상 높으면 LL / LR 경우에 맞춰 회전한다.
+    - 오른쪽이 2 이상 높으면 RR / RL 경우에 맞춰 회전한다.
+
+    Args:
+        node (Node): 균형을 검사할 서브트리의 루트
+        copy (bool): True이면 회전으로 수정되는 자식/손자 노드를 먼저 복사한다.
+
+    Returns:
+        Node: 균형이 복구된 서브트리의 루트
+    """
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+
+    if balance > 1:
+        assert node.left is not None
+        if _height(node.left.left) < _height(node.left.right):
+            child = _copy(node.left) if copy else node.left
+            node.left = _rotate_left(child, copy)  # LR 경우
+        return _rotate_right(node, copy)
+
+    if balance < -1:
+        assert node.right is not None
+        if _height(node.right.right) < _height(node.right.left):
+            child = _copy(node.right) if copy else node.right
+            node.right = _rotate_right(child, copy)  # RL 경우
+        return _rotate_left(node, copy)
+
+    return node
+
+
+def _remove_min(node: Node, copy: bool = False) -> Tuple[Optional[Node], Node]:
+    """
+    서브트리에서 가장 작은 키의 노드를 떼어내고 균형을 복구한다.
+
+    왼쪽 끝까지 반복문으로 내려간 뒤, 지나온 경로를 거슬러 올라가며 균형을 복구한다.
+
+    Args:
+        node (Node): 서브트리의 루트
+        copy (bool): True이면 경로의 노드를 수정하기 전에 복사한다.
+                     (떼어낸 최소 노드는 복사하지 않고 그대로 반환한다)
+
+    Returns:
+        tuple: (최소 노드를 뗀 뒤의 서브트리 루트, 떼어낸 최소 노드)
+    """
+    if node.left is None:
+        return node.right, node
+
+    curr = _copy(node) if copy else node
+    path: List[Node] = [curr]
+
+    while curr.left is not None and curr.left.left is not None:
+        child = _copy(curr.left) if copy else curr.left
+        curr.left = child
+        path.append(child)
+        curr = child
+
+    smallest = curr.left
+    assert smallest is not None
+    curr.left = smallest.right
 
+    sub = _rebalance(path.pop(), copy)
+    while path:
+        parent = path.pop()
+        parent.left = sub
+        sub = _rebalance(parent, copy)
+
+    return sub, smallest
+
+
+def _join(left: Optional[Node], mid: Node, right: Optional[Node], copy: bool = False) -> Node:
+    """
+    모든 키가 left < mid.key < right 인 두 서브트리와 노드 mid를 하나의 트리로 잇는다.
+
+    두 트리의 높이 차이가 1 이하이면 mid를 루트로 삼는다. 그렇지 않으면 높은 쪽
+    트리의 안쪽 가장자리(left가 높으면 오른쪽 끝 경로)를 따라 낮은 쪽과 높이가
+    비슷해질 때까지 내려가 그 자리에 mid를 끼워 넣고, 올라오며 균형을 복구한다.
+    비용은 O(|높이 차이| + 1)이다.
+
+    Args:
+        left (Node or None): mid보다 작은 키들의 서브트리
+        mid (Node): 가운데에 놓을 노드 (자식 링크는 덮어쓴다)
+        right (Node or None): mid보다 큰 키들의 서브트리
+        copy (bool): True이면 수정하는 기존 노드를 먼저 복사한다.
+                     (mid는 호출자가 이미 복사했다고 가정한다)
+
+    Returns:
+        Node: 합쳐진 트리의 루트
+    """
+    hl, hr = _height(left), _height(right)
+
+    if abs(hl - hr) <= 1:
+        mid.left = left
+        mid.right = right
+        _update(mid)
+        return mid
+
+    path: List[Node] = []
+
+    if hl > hr:
+        assert left is not None
+        curr = _copy(left) if copy else left
+        while _height(curr.right) > hr + 1:
+            path.append(curr)
+            child = curr.right
+            assert child is not None
+            if copy:
+                child = _copy(child)
+            curr.right = child
+            curr = child
+
+        curr.right = _join(curr.right, mid, right, copy)
+        sub = _rebalance(curr, copy)
+        while path:
+            parent = path.pop()
+            parent.right = sub
+            sub = _rebalance(parent, copy)
+        return sub
+
+    assert right is not None
+    curr = _copy(right) if copy else right
+    while _height(curr.left) > hl + 1:
+        path.append(curr)
+        child = curr.left
+        assert child is not None
+        if copy:
+            child = _copy(child)
+        curr.left = child
+        curr = child
+
+    curr.left = _join(left, mid, curr.left, copy)
+    sub = _rebalance(curr, copy)
+    while path:
+        parent = path.pop()
+        parent.left = sub
+        sub = _rebalance(parent, copy)
+    return sub
+
+
+def _split(root: Optional[Node], key, copy: bool = False) -> Tuple[Optional[Node], Optional[Node]]:
+    """
+    트리를 key보다 작은 키들의 트리와 key 이상인 키들의 트리로 나눈다.
+
+    루트에서 key를 찾아 내려가며 경로를 기억한 뒤, 아래에서부터 경로의 각 노드를
+    그 노드의 반대편 서브트리와 함께 왼쪽/오른쪽 결과에 _join으로 붙인다.
+    균형 트리에서는 O(log n)이다.
+
+    Args:
+        root (Node or None): 나눌 트리의 루트
+        key (Any): 기준 키
+        copy (bool): True이면 기존 노드를 수정하지 않고 복사해서 사용한다.
+
+    Returns:
+        tuple: (key 미만 트리의 루트, key 이상 트리의 루트)
+    """
+    path: List[Tuple[Node, bool]] = []
+    curr = root
+    found: Optional[Node] = None
+
+    while curr:
+        if key < curr.key:
+            path.append((curr, True))
+            curr = curr.left
+        elif key > curr.key:
+            path.append((curr, False))
+            curr = curr.right
+        else:
+            found = curr
+            break
+
+    left: Optional[Node] = None
+    right: Optional[Node] = None
+
+    if found:
+        left = found.left
+        right = _join(None, _copy(found) if copy else found, found.right, copy)
+
+    for node, went_left in reversed(path):
+        # node의 키와 반대편 서브트리는 통째로 한쪽 결과에 속한다.
+        mid = _copy(node) if copy else node
+        if went_left:
+            right = _join(right, mid, node.right, copy)
+        else:
+            left = _join(node.left, mid, left, copy)
+
+    return left, right
+
+
+def _build(items: List[Tuple[Any, Any]], lo: int, hi: int) -> Optional[Node]:
+    """
+    정렬된 items[lo:hi]로 완전 균형 서브트리를 만들고 루트를 반환한다.
+
+    가운데 원소를 루트로 삼고 좌우 절반을 재귀적으로 만든다.
+    재귀 깊이는 O(log n)이고, 각 원소는 노드로 한 번만 만들어진다.
+
+    Args:
+        items (list): 키 순서로 정렬된 (key, data) 쌍의 리스트
+        lo (int): 시작 인덱스(포함)
+        hi (int): 끝 인덱스(미포함)
+
+    Returns:
+        Node or None: 만들어진 서브트리의 루트
+    """
+    if lo >= hi:
+        return None
+
+    mid = (lo + hi) // 2
+    node = Node(*items[mid])
+    node.left = _build(items, lo, mid)
+    node.right = _build(items, mid + 1, hi)
+    _update(node)
+    return node
 
 
 class BinaryTree:
-    def __init__(self, r: Optional[Node]):
+    # True이면 기존 노드를 수정하지 않고 경로의 노드를 복사한다. (PersistentBinaryTree)
+    copy_on_write: bool = False
+
+    def __init__(self, r: Optional[Node] = None):
         """
         이진 트리를 초기화한다.
 
+        r의 left/right를 직접 연결해 만든 트리일 수 있으므로, 후위 순회 한 번으로
+        모든 노드의 노드 수(count)와 높이(height)를 다시 계산한다. (O(n))
+        트리를 넘긴 뒤에 노드를 직접 연결하는 것은 지원하지 않는다.
+        (insert/delete 등 트리의 메서드로만 바꿔야 한다)
+
         Args:
             r (Node or None): 트리의 루트 노드. 빈 트리는 None을 사용한다.
         """
         self.root: Optional[Node] = r
 
+        for node in _iter_postorder(r):
+            _update(node)
+
+    @classmethod
+    def _wrap(cls: Type[T], root: Optional[Node]) -> T:
+        """
+        count/height가 이미 올바른 루트로 트리를 O(1)에 만든다. (다시 계산하지 않는다)
+
+        Args:
+            root (Node or None): 트리의 루트 노드
+
+        Returns:
+            BinaryTree: root를 가진 트리 (호출한 클래스의 인스턴스)
+        """
+        tree = cls()
+        tree.root = root
+        return tree
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[Any, Any]]) -> "BinaryTree":
+        """
+        키 오름차순으로 정렬된 (key, data) 쌍들로 완전 균형 트리를 O(n)에 만든다.
+
+        insert를 n번 호출하는 대신 노드를 한 번씩만 만들어 바로 연결하므로,
+        만들어진 트리의 높이는 ceil(log2(n + 1))이다.
+
+        Args:
+            items (Iterable[tuple]): 키 오름차순의 (key, data) 쌍
+
+        Returns:
+            BinaryTree: 만들어진 트리 (호출한 클래스의 인스턴스)
+
+        Raises:
+            KeyError: 같은 키가 두 번 나오면 발생
+            ValueError: 키가 오름차순이 아니면 발생
+        """
+        pairs = list(items)
+
+        for i in range(1, len(pairs)):
+            prev_key, key = pairs[i - 1][0], pairs[i][0]
+            if not (prev_key < key):
+                if not (key < prev_key):
+                    raise KeyError(key)
+                raise ValueError("items must be sorted by key")
+
+        return cls._wrap(_build(pairs, 0, len(pairs)))
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[Tuple[Any, Any]]) -> "BinaryTree":
+        """
+        임의 순서의 (key, data) 쌍들을 키로 정렬한 뒤 from_sorted로 한 번에 만든다.
+
+        전체 비용은 정렬의 O(n log n)이며, 노드 생성/연결은 O(n)이다.
+
+        Args:
+            items (Iterable[tuple]): (key, data) 쌍
+
+        Returns:
+            BinaryTree: 만들어진 트리 (호출한 클래스의 인스턴스)
+
+        Raises:
+            KeyError: 같은 키가 두 번 나오면 발생
+        """
+        return cls.from_sorted(sorted(items, key=itemgetter(0)))
+
+    @classmethod
+    def join(cls, left: "BinaryTree", right: "BinaryTree") -> "BinaryTree":
+        """
+        모든 키가 left < right 인 두 트리를 하나로 합친다.
+
+        right의 최소 노드를 떼어 가운데 노드로 삼고 _join으로 잇는다.
+        두 트리가 균형 트리이면 O(log n)이다. 두 트리의 노드는 결과 트리로
+        옮겨지므로 left와 right는 빈 트리가 된다. (copy_on_write 트리는 그대로 남는다)
+
+        Args:
+            left (BinaryTree): 작은 키들의 트리
+            right (BinaryTree): 큰 키들의 트리
+
+        Returns:
+            BinaryTree: 합쳐진 트리 (호출한 클래스의 인스턴스)
+
+        Raises:
+            ValueError: left의 최대 키가 right의 최소 키보다 작지 않으면 발생
+        """
+        copy = left.copy_on_write or right.copy_on_write
+        l, r = left.root, right.root
+
+        if l and r:
+            # 합치는 데 쓰는 버전(l, r)의 최대/최소 키를 비교한다.
+            hi, lo = l, r
+            while hi.right:
+                hi = hi.right
+            while lo.left:
+                lo = lo.left
+
+            if not (hi.key < lo.key):
+                raise ValueError("keys of left must all be smaller than keys of right")
+
+            rest, mid = _remove_min(r, copy)
+            root: Optional[Node] = _join(l, _copy(mid) if copy else mid, rest, copy)
+        else:
+            root = l or r
+
+        if not copy:
+            left.root = None
+            right.root = None
+
+        return cls._wrap(root)
+
+    @classmethod
+    def merge(cls, a: "BinaryTree", b: "BinaryTree") -> "BinaryTree":
+        """
+        키 범위가 겹칠 수 있는 두 트리를 합친 새 완전 균형 트리를 O(n + m)에 만든다.
+
+        두 트리를 동시에 중위 순회하며 정렬된 (key, data) 쌍으로 병합한 뒤
+        from_sorted와 같은 방식으로 한 번에 만든다. a와 b는 바뀌지 않는다.
+
+        Args:
+            a (BinaryTree): 합칠 트리
+            b (BinaryTree): 합칠 트리
+
+        Returns:
+            BinaryTree: 합쳐진 트리 (호출한 클래스의 인스턴스)
+
+        Raises:
+            KeyError: 두 트리에 같은 키가 있으면 발생
+        """
+        pairs: List[Tuple[Any, Any]] = []
+        it_a, it_b = _iter_inorder(a.root), _iter_inorder(b.root)
+        x, y = next(it_a, None), next(it_b, None)
+
+        while x and y:
+            if x.key < y.key:
+                pairs.append((x.key, x.data))
+                x = next(it_a, None)
+            elif y.key < x.key:
+                pairs.append((y.key, y.data))
+                y = next(it_b, None)
+            else:
+                raise KeyError(x.key)
+
+        while x:
+            pairs.append((x.key, x.data))
+            x = next(it_a, None)
+
+        while y:
+            pairs.append((y.key, y.data))
+            y = next(it_b, None)
+
+        return cls._wrap(_build(pairs, 0, len(pairs)))
+
+    def split(self, key) -> Tuple["BinaryTree", "BinaryTree"]:
+        """
+        트리를 key 미만의 키들과 key 이상의 키들로 이루어진 두 트리로 나눈다.
+
+        균형 트리에서는 O(log n)이다. 노드는 두 결과 트리로 옮겨지므로 이 트리는
+        빈 트리가 된다. (copy_on_write 트리는 그대로 남는다)
+
+        Args:
+            key (Any): 기준 키 (트리에 없어도 된다)
+
+        Returns:
+            tuple: (key 미만 트리, key 이상 트리) - 이 트리와 같은 클래스의 인스턴스
+        """
+        left, right = _split(self.root, key, self.copy_on_write)
+
+        if not self.copy_on_write:
+            self.root = None
+
+        return type(self)._wrap(left), type(self)._wrap(right)
+
+    @staticmethod
+    def open(path: str) -> tree_snapshot.MappedBinaryTree:
+        """
+        save로 저장한 스냅샷 파일을 메모리 매핑하여 읽기 전용 트리로 연다.
+
+        노드를 다시 삽입하지 않고 파일을 그대로 매핑하므로 여는 비용이 트리 크기와
+        무관하다. 반환된 트리는 get/floor/ceiling/range/inorder를 지원한다.
+
+        Args:
+            path (str): 스냅샷 파일 경로
+
+        Returns:
+            MappedBinaryTree: 메모리 매핑된 읽기 전용 트리
+        """
+        return tree_snapshot.MappedBinaryTree(path)
+
+    def save(self, path: str) -> None:
+        """
+        트리를 메모리 매핑 가능한 스냅샷 파일(노드 테이블 + 키/데이터 힙)로 저장한다.
+
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        root = self.root  # 저장하는 동안 같은 버전만 보도록 루트를 한 번만 읽는다.
+        tree_snapshot.save(root, _height(root), path)
+
     def size(self) -> int:
         """
         트리의 전체 노드 개수를 반환한다.
@@ -150,10 +813,7 @@ class BinaryTree:
         Returns:
             int: 트리의 노드 수
         """
-        if self.root:
-            return self.root.size()
-        else:
-            return 0
+        return _count(self.root)
 
     def depth(self) -> int:
         """
@@ -162,10 +822,7 @@ class BinaryTree:
         Returns:
             int: 트리의 깊이
         """
-        if self.root:
-            return self.root.depth()
-        else:
-            return 0
+        return _height(self.root)
 
     def inorder(self) -> List[Any]:
         """
@@ -174,10 +831,7 @@ class BinaryTree:
         Returns:
             list: 중위 순회 결과(노드 데이터의 리스트)
         """
-        if self.root:
-            return self.root.inorder()
-        else:
-            return []
+        return list(self.iter_inorder())
 
     def preorder(self) -> List[Any]:
         """
@@ -186,10 +840,7 @@ class BinaryTree:
         Returns:
             list: 전위 순회 결과(노드 데이터의 리스트)
         """
-        if self.root:
-            return self.root.preorder()
-        else:
-            return []
+        return list(self.iter_preorder())
 
     def postorder(self) -> List[Any]:
         """
@@ -198,39 +849,487 @@ class BinaryTree:
         Returns:
             list: 후위 순회 결과(노드 데이터의 리스트)
         """
-        if self.root:
-            return self.root.postorder()
+        return list(self.iter_postorder())
+
+    def iter_inorder(self) -> Iterator[Any]:
+        """
+        트리를 중위 순회하며 노드 데이터를 하나씩 내보내는 제너레이터를 반환한다.
+
+        결과 리스트를 만들지 않으므로 중간에 순회를 멈출 수 있다.
+
+        Yields:
+            Any: 중위 순회 순서의 노드 데이터
+        """
+        for node in _iter_inorder(self.root):
+            yield node.data
+
+    def iter_preorder(self) -> Iterator[Any]:
+        """
+        트리를 전위 순회하며 노드 데이터를 하나씩 내보내는 제너레이터를 반환한다.
+
+        Yields:
+            Any: 전위 순회 순서의 노드 데이터
+        """
+        for node in _iter_preorder(self.root):
+            yield node.data
+
+    def iter_postorder(self) -> Iterator[Any]:
+        """
+        트리를 후위 순회하며 노드 데이터를 하나씩 내보내는 제너레이터를 반환한다.
+
+        Yields:
+            Any: 후위 순회 순서의 노드 데이터
+        """
+        for node in _iter_postorder(self.root):
+            yield node.data
+
+    def iter_levels(self, max_depth: Optional[int] = None) -> Iterator[Any]:
+        """
+        트리를 넓이 우선(레벨 순서)으로 순회하며 노드 데이터를 하나씩 내보낸다.
+
+        큐로 deque를 사용하므로 꺼내기(popleft)가 O(1)이고, 전체 순회는 O(n)이다.
+
+        Args:
+            max_depth (int or None): 내려갈 최대 깊이 (루트만이면 1).
+                                     None이면 트리 전체를 순회한다.
+
+        Yields:
+            Any: 넓이 우선 순회 순서의 노드 데이터
+        """
+        for level in _iter_levels(self.root, max_depth):
+            for node in level:
+                yield node.data
+
+    def iter_level_batches(self, max_depth: Optional[int] = None) -> Iterator[List[Any]]:
+        """
+        트리를 레벨 단위로 순회하며 한 레벨의 노드 데이터를 리스트로 묶어 내보낸다.
+
+        max_depth를 주면 그 깊이까지만 내려가므로, 트리 윗부분만 요약할 때
+        나머지 노드는 전혀 방문하지 않는다.
+
+        Args:
+            max_depth (int or None): 내려갈 최대 깊이 (루트만이면 1).
+                                     None이면 트리 전체를 순회한다.
+
+        Yields:
+            list: 한 레벨에 있는 노드 데이터의 리스트 (왼쪽부터)
+        """
+        for level in _iter_levels(self.root, max_depth):
+            yield [node.data for node in level]
+
+    def get(self, key) -> Optional[Any]:
+        """
+        key에 대응되는 데이터를 반환한다. O(높이)에 동작한다.
+
+        Args:
+            key (Any): 찾을 키
+
+        Returns:
+            Any or None: key에 대응되는 데이터, key가 없으면 None
+        """
+        node = _find(self.root, key)
+        return node.data if node else None
+
+    def delete(self, key) -> Any:
+        """
+        key를 가진 노드를 트리에서 제거하고 그 데이터를 반환한다.
+
+        자식이 둘인 노드는 오른쪽 서브트리의 최소 노드(후속자)의 키/데이터를
+        가져오고, 대신 후속자 노드를 제거한다. 제거 후 지나온 경로를 거슬러
+        올라가며 노드 수/높이를 갱신한다.
+
+        Args:
+            key (Any): 제거할 키
+
+        Returns:
+            Any: 제거된 노드의 데이터
+
+        Raises:
+            KeyError: key가 트리에 없으면 발생
+        """
+        path: List[Node] = []
+        curr = self.root
+
+        while curr and key != curr.key:
+            path.append(curr)
+            curr = curr.left if key < curr.key else curr.right
+
+        if curr is None:
+            raise KeyError(key)
+
+        data = curr.data
+
+        if curr.left and curr.right:
+            # 후속자를 찾아 내려간 뒤, 후속자의 키/데이터를 curr로 옮긴다.
+            path.append(curr)
+            successor = curr.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+
+            curr.key = successor.key
+            curr.data = successor.data
+            curr = successor
+
+        # 이제 curr는 자식이 최대 하나이므로 그 자식으로 대체한다.
+        child = curr.left if curr.left else curr.right
+
+        if not path:
+            self.root = child
+        elif path[-1].left is curr:
+            path[-1].left = child
         else:
-            return []
+            path[-1].right = child
 
-    def bft(self) -> List[Any]:
+        for node in reversed(path):
+            _update(node)
+
+        return data
+
+    def floor(self, key) -> Optional[Any]:
         """
-        트리의 넓이 우선 순회(Breath-First Traversal) 결과를 리스트로 반환한다.
+        key 이하인 키 중 가장 큰 키를 반환한다.
+
+        Args:
+            key (Any): 기준 키 (트리에 없어도 된다)
 
         Returns:
-            list: 넓이 우선 순회 결과(노드 데이터의 리스트)
+            Any or None: key 이하의 최대 키, 없으면 None
         """
-        if not self.root:
-            return []
-        
-        traversal: List[Any] = []
-        queue: List[Node] = [self.root]
+        result = None
+        curr = self.root
 
-        while queue:
-            current = queue.pop(0)
-            traversal.append(current.data)
+        while curr:
+            if key < curr.key:
+                curr = curr.left
+            elif key > curr.key:
+                result = curr.key
+                curr = curr.right
+            else:
+                return curr.key
 
-            if current.left:
-                queue.append(current.left)
+        return result
 
-            if current.right:
-                queue.append(current.right)
+    def ceiling(self, key) -> Optional[Any]:
+        """
+        key 이상인 키 중 가장 작은 키를 반환한다.
+
+        Args:
+            key (Any): 기준 키 (트리에 없어도 된다)
+
+        Returns:
+            Any or None: key 이상의 최소 키, 없으면 None
+        """
+        result = None
+        curr = self.root
+
+        while curr:
+            if key > curr.key:
+                curr = curr.right
+            elif key < curr.key:
+                result = curr.key
+                curr = curr.left
+            else:
+                return curr.key
+
+        return result
+
+    def range(self, lo=None, hi=None) -> Iterator[Tuple[Any, Any]]:
+        """
+        lo <= key < hi 를 만족하는 (key, data) 쌍을 키 순서대로 내보낸다.
+
+        범위와 겹치지 않는 서브트리는 내려가지 않으므로
+        O(log n + k) 시간(k는 결과 개수), O(높이) 메모리에 동작한다.
+
+        Args:
+            lo (Any or None): 하한(포함). None이면 하한이 없다.
+            hi (Any or None): 상한(미포함). None이면 상한이 없다.
+
+        Yields:
+            tuple: (key, data)
+        """
+        stack: List[Node] = []
+        curr = self.root
+
+        while stack or curr:
+            while curr:
+                if lo is not None and curr.key < lo:
+                    # curr와 왼쪽 서브트리는 모두 lo보다 작다.
+                    curr = curr.right
+                else:
+                    stack.append(curr)
+                    curr = curr.left
+
+            if not stack:
+                return
+
+            node = stack.pop()
+            if hi is not None and not (node.key < hi):
+                return
+
+            yield node.key, node.data
+            curr = node.right
+
+    def select(self, k: int) -> Any:
+        """
+        k번째로 작은 키를 반환한다. (k는 0부터 시작)
+
+        각 노드에 저장된 서브트리 노드 수를 이용해 루트에서 한 번만 내려가므로
+        O(높이)에 동작한다.
+
+        Args:
+            k (int): 찾을 순위 (0 이상 size() 미만)
+
+        Returns:
+            Any: k번째로 작은 키
+
+        Raises:
+            IndexError: k가 범위를 벗어나면 발생
+        """
+        # 범위 검사와 탐색이 같은 버전을 보도록 루트를 한 번만 읽는다.
+        root = self.root
+        if k < 0 or k >= _count(root):
+            raise IndexError("select index out of range")
+
+        curr = root
+        while curr:
+            left_count = _count(curr.left)
+
+            if k < left_count:
+                curr = curr.left
+            elif k > left_count:
+                k -= left_count + 1
+                curr = curr.right
+            else:
+                return curr.key
+
+        # 노드 수가 올바르게 유지된다면 여기 오지 않는다.
+        raise RuntimeError("Tree is corrupted: subtree counts are inconsistent")
+
+    def rank(self, key) -> int:
+        """
+        트리에서 key보다 작은 키의 개수를 반환한다.
+
+        key가 트리에 있다면 select(rank(key)) == key 가 성립한다. O(높이)에 동작한다.
+
+        Args:
+            key (Any): 순위를 구할 키 (트리에 없어도 된다)
+
+        Returns:
+            int: key보다 작은 키의 개수
+        """
+        result = 0
+        curr = self.root
+
+        while curr:
+            if key < curr.key:
+                curr = curr.left
+            elif key > curr.key:
+                result += _count(curr.left) + 1
+                curr = curr.right
+            else:
+                return result + _count(curr.left)
+
+        return result
+
+    def bft(self, max_depth: Optional[int] = None) -> List[Any]:
+        """
+        트리의 넓이 우선 순회(Breath-First Traversal) 결과를 리스트로 반환한다.
+
+        Args:
+            max_depth (int or None): 내려갈 최대 깊이 (루트만이면 1).
+                                     None이면 트리 전체를 순회한다.
+
+        Returns:
+            list: 넓이 우선 순회 결과(노드 데이터의 리스트)
+        """
+        return list(self.iter_levels(max_depth))
 
-        return traversal
-    
     def insert(self, key, data):
         if self.root:
             self.root.insert(key, data)
         else:
             self.root = Node(key, data)
 
+
+class BalancedBinaryTree(BinaryTree):
+    def __init__(self, r: Optional[Node] = None):
+        """
+        삽입 시마다 AVL 회전으로 균형을 유지하는 이진 탐색 트리를 초기화한다.
+
+        키가 (거의) 정렬된 순서로 들어와도 트리 높이가 O(log n)으로 유지되므로,
+        삽입 비용이 O(log n)이고 깊은 재귀로 인한 RecursionError가 발생하지 않는다.
+        순회 메서드(inorder/preorder/postorder/bft)는 BinaryTree와 동일하게 동작한다.
+
+        Args:
+            r (Node or None): 트리의 루트 노드. 각 노드의 height가 올바르게
+                              설정된 AVL 트리여야 한다. 빈 트리는 None을 사용한다.
+        """
+        super().__init__(r)
+
+    def insert(self, key, data) -> None:
+        """
+        트리에 새로운 값을 삽입하고, 삽입 경로를 따라 균형을 복구한다.
+
+        Args:
+           key (Any): 삽입할 노드의 키 값 (비교 기준)
+           data (Any): 키에 대응되는 데이터
+
+        Raises:
+            KeyError: 같은 키가 이미 존재하면 발생
+        """
+        self.root = self._insert(self.root, key, data)
+
+    def _insert(self, node: Optional[Node], key, data) -> Node:
+        """
+        node를 루트로 하는 서브트리에 값을 삽입하고 새 서브트리 루트를 반환한다.
+
+        AVL 트리의 높이는 O(log n)이므로 재귀 깊이도 O(log n)이다.
+
+        Args:
+            node (Node or None): 서브트리의 루트
+            key (Any): 삽입할 키
+            data (Any): 키에 대응되는 데이터
+
+        Returns:
+            Node: 균형이 복구된 서브트리의 루트
+        """
+        if node is None:
+            return Node(key, data)
+
+        if self.copy_on_write:
+            node = _copy(node)
+
+        if key < node.key:
+            node.left = self._insert(node.left, key, data)
+        elif key > node.key:
+            node.right = self._insert(node.right, key, data)
+        else:
+            raise KeyError(key)
+
+        return _rebalance(node, self.copy_on_write)
+
+    def delete(self, key) -> Any:
+        """
+        key를 가진 노드를 제거하고, 제거 경로를 따라 균형을 복구한다.
+
+        Args:
+            key (Any): 제거할 키
+
+        Returns:
+            Any: 제거된 노드의 데이터
+
+        Raises:
+            KeyError: key가 트리에 없으면 발생
+        """
+        node = _find(self.root, key)
+        if node is None:
+            raise KeyError(key)
+
+        self.root = self._delete(self.root, key)
+        return node.data
+
+    def _delete(self, node: Optional[Node], key) -> Optional[Node]:
+        """
+        node를 루트로 하는 서브트리에서 key를 제거하고 새 서브트리 루트를 반환한다.
+
+        Args:
+            node (Node or None): 서브트리의 루트
+            key (Any): 제거할 키
+
+        Returns:
+            Node or None: 균형이 복구된 서브트리의 루트
+        """
+        if node is None:
+            raise KeyError(key)
+
+        copy = self.copy_on_write
+
+        if key < node.key:
+            if copy:
+                node = _copy(node)
+            node.left = self._delete(node.left, key)
+        elif key > node.key:
+            if copy:
+                node = _copy(node)
+            node.right = self._delete(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+
+            # 자식이 둘이면 오른쪽 서브트리의 최소 노드를 이 자리로 올린다.
+            right, successor = _remove_min(node.right, copy)
+            if copy:
+                successor = _copy(successor)
+            successor.left = node.left
+            successor.right = right
+            node = successor
+
+        return _rebalance(node, copy)
+
+
+class PersistentBinaryTree(BalancedBinaryTree):
+    copy_on_write = True
+
+    def __init__(self, r: Optional[Node] = None):
+        """
+        경로 복사(path copying)로 갱신하는 AVL 트리를 초기화한다.
+
+        insert/delete는 기존 노드를 절대 수정하지 않고, 루트에서 바뀐 노드까지의
+        경로만 새로 만든 뒤 새 루트를 self.root에 한 번에 대입(게시)한다.
+        따라서 이미 읽어 간 루트(스냅샷)는 이후의 쓰기와 무관하게 항상 일관된
+        트리를 가리키며, 읽기 스레드는 락 없이 탐색/순회할 수 있다.
+
+        쓰기끼리는 내부 락(lock)으로 직렬화한다. 한 번의 호출로 끝나는 읽기
+        (get, range, inorder 등)는 그대로 호출해도 되고, 여러 번의 읽기가 같은
+        버전을 봐야 하면 snapshot()으로 얻은 트리를 사용한다.
+
+        Args:
+            r (Node or None): 트리의 루트 노드 (AVL 트리여야 한다)
+        """
+        super().__init__(r)
+        self.lock = threading.Lock()
+
+    def snapshot(self) -> "PersistentBinaryTree":
+        """
+        현재 루트를 공유하는 불변 스냅샷을 O(1)에 반환한다.
+
+        스냅샷은 이후 이 트리에 일어나는 쓰기의 영향을 받지 않는다.
+        스냅샷 자체에 쓰기를 해도 경로 복사가 일어나므로 원본은 바뀌지 않는다.
+
+        Returns:
+            PersistentBinaryTree: 현재 버전의 트리
+        """
+        return PersistentBinaryTree._wrap(self.root)
+
+    def insert(self, key, data) -> None:
+        """
+        경로를 복사하여 값을 삽입하고, 새 루트를 원자적으로 게시한다.
+
+        Args:
+           key (Any): 삽입할 노드의 키 값 (비교 기준)
+           data (Any): 키에 대응되는 데이터
+
+        Raises:
+            KeyError: 같은 키가 이미 존재하면 발생
+        """
+        with self.lock:
+            super().insert(key, data)
+
+    def delete(self, key) -> Any:
+        """
+        경로를 복사하여 key를 제거하고, 새 루트를 원자적으로 게시한다.
+
+        Args:
+            key (Any): 제거할 키
+
+        Returns:
+            Any: 제거된 노드의 데이터
+
+        Raises:
+            KeyError: key가 트리에 없으면 발생
+        """
+        with self.lock:
+            return super().delete(key)
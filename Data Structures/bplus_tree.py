@@ -0,0 +1,242 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+
+class LeafNode:
+    def __init__(self):
+        """
+        B+ 트리의 리프 노드를 초기화한다.
+
+        리프는 정렬된 키와 데이터를 배열(리스트)로 함께 들고 있으며,
+        next로 오른쪽 이웃 리프와 연결되어 범위 탐색을 순차적으로 할 수 있다.
+        """
+        self.keys: List[Any] = []
+        self.data: List[Any] = []
+        self.next: Optional["LeafNode"] = None
+
+
+class InternalNode:
+    def __init__(self):
+        """
+        B+ 트리의 내부 노드를 초기화한다.
+
+        children[i]의 모든 키 k는 keys[i-1] <= k < keys[i] 를 만족한다.
+        (len(children) == len(keys) + 1)
+        """
+        self.keys: List[Any] = []
+        self.children: List[Union["InternalNode", LeafNode]] = []
+
+
+class BPlusTree:
+    def __init__(self, fanout: int = 64):
+        """
+        노드 하나에 여러 키를 담는 B+ 트리를 초기화한다.
+
+        이진 탐색 트리는 레벨마다 노드 하나를 따라가므로 n개의 키에서 약 log2(n)번
+        포인터를 따라가야 하지만, B+ 트리는 노드 안의 키 배열을 이진 탐색(bisect)하고
+        약 log_fanout(n)번만 내려간다. (예: 백만 개의 키, fanout 64 → 높이 4)
+        데이터는 모두 리프에 있고 리프끼리 연결되어 있으므로 범위 탐색은
+        리프를 차례로 읽기만 하면 된다.
+
+        Args:
+            fanout (int): 노드 하나가 가질 수 있는 최대 키(리프)/자식(내부 노드) 수.
+                          3 이상이어야 한다.
+
+        Raises:
+            ValueError: fanout이 3 미만이면 발생
+        """
+        if fanout < 3:
+            raise ValueError("fanout must be at least 3")
+
+        self.fanout: int = fanout
+        self.root: Union[InternalNode, LeafNode] = LeafNode()
+        self.count: int = 0
+        self.height: int = 1
+
+    def size(self) -> int:
+        """
+        트리에 저장된 키의 개수를 반환한다.
+
+        Returns:
+            int: 키 개수
+        """
+        return self.count
+
+    def depth(self) -> int:
+        """
+        트리의 깊이(루트부터 리프까지의 레벨 수)를 반환한다. 빈 트리는 0이다.
+
+        Returns:
+            int: 트리의 깊이
+        """
+        return self.height if self.count else 0
+
+    def _find_leaf(self, key) -> LeafNode:
+        """
+        key가 들어 있어야 할 리프를 찾는다.
+
+        Args:
+            key (Any): 찾을 키
+
+        Returns:
+            LeafNode: key가 속하는 리프
+        """
+        node = self.root
+        while isinstance(node, InternalNode):
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def _first_leaf(self) -> LeafNode:
+        """
+        가장 왼쪽 리프(가장 작은 키가 있는 리프)를 반환한다.
+
+        Returns:
+            LeafNode: 가장 왼쪽 리프
+        """
+        node = self.root
+        while isinstance(node, InternalNode):
+            node = node.children[0]
+        return node
+
+    def get(self, key) -> Optional[Any]:
+        """
+        key에 대응되는 데이터를 반환한다.
+
+        Args:
+            key (Any): 찾을 키
+
+        Returns:
+            Any or None: key에 대응되는 데이터, key가 없으면 None
+        """
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+
+        if i < len(leaf.keys) and not (key < leaf.keys[i]):
+            return leaf.data[i]
+
+        return None
+
+    def insert(self, key, data) -> None:
+        """
+        트리에 새로운 값을 삽입한다.
+
+        리프가 넘치면 반으로 나누고, 오른쪽 절반의 첫 키를 부모에 올린다.
+        부모도 넘치면 같은 방식으로 위로 전파하며, 루트가 나뉘면 높이가 1 늘어난다.
+
+        Args:
+           key (Any): 삽입할 키 (비교 기준)
+           data (Any): 키에 대응되는 데이터
+
+        Raises:
+            KeyError: 같은 키가 이미 존재하면 발생
+        """
+        path: List[Tuple[InternalNode, int]] = []
+        node = self.root
+
+        while isinstance(node, InternalNode):
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+
+        i = bisect_left(node.keys, key)
+        if i < len(node.keys) and not (key < node.keys[i]):
+            raise KeyError(key)
+
+        node.keys.insert(i, key)
+        node.data.insert(i, data)
+        self.count += 1
+
+        if len(node.keys) <= self.fanout:
+            return
+
+        # 리프 분할
+        mid = len(node.keys) // 2
+        sibling = LeafNode()
+        sibling.keys = node.keys[mid:]
+        sibling.data = node.data[mid:]
+        del node.keys[mid:]
+        del node.data[mid:]
+        sibling.next = node.next
+        node.next = sibling
+
+        separator = sibling.keys[0]
+        new_child: Union[InternalNode, LeafNode] = sibling
+
+        # 분할을 부모 쪽으로 전파
+        while path:
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, new_child)
+
+            if len(parent.children) <= self.fanout:
+                return
+
+            mid = len(parent.keys) // 2
+            right = InternalNode()
+            separator = parent.keys[mid]
+            right.keys = parent.keys[mid + 1:]
+            right.children = parent.children[mid + 1:]
+            del parent.keys[mid:]
+            del parent.children[mid + 1:]
+            new_child = right
+
+        # 루트까지 나뉘었으므로 새 루트를 만든다.
+        root = InternalNode()
+        root.keys = [separator]
+        root.children = [self.root, new_child]
+        self.root = root
+        self.height += 1
+
+    def iter_inorder(self) -> Iterator[Any]:
+        """
+        연결된 리프를 왼쪽부터 차례로 읽으며 데이터를 키 순서대로 내보낸다.
+
+        Yields:
+            Any: 키 순서의 데이터
+        """
+        leaf: Optional[LeafNode] = self._first_leaf()
+
+        while leaf:
+            yield from leaf.data
+            leaf = leaf.next
+
+    def inorder(self) -> List[Any]:
+        """
+        키 순서대로 정렬된 데이터의 리스트를 반환한다.
+
+        Returns:
+            list: 키 순서의 데이터 리스트
+        """
+        return list(self.iter_inorder())
+
+    def range(self, lo=None, hi=None) -> Iterator[Tuple[Any, Any]]:
+        """
+        lo <= key < hi 를 만족하는 (key, data) 쌍을 키 순서대로 내보낸다.
+
+        lo가 속한 리프를 한 번만 찾아 내려간 뒤, 그 다음부터는
+        리프 연결(next)을 따라 순차적으로 읽는다.
+
+        Args:
+            lo (Any or None): 하한(포함). None이면 하한이 없다.
+            hi (Any or None): 상한(미포함). None이면 상한이 없다.
+
+        Yields:
+            tuple: (key, data)
+        """
+        if lo is None:
+            leaf: Optional[LeafNode] = self._first_leaf()
+            i = 0
+        else:
+            leaf = self._find_leaf(lo)
+            i = bisect_left(leaf.keys, lo)
+
+        while leaf:
+            keys = leaf.keys
+            while i < len(keys):
+                if hi is not None and not (keys[i] < hi):
+                    return
+                yield keys[i], leaf.data[i]
+                i += 1
+
+            leaf = leaf.next
+            i = 0
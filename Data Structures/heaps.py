@@ -1,9 +1,33 @@
-from typing import Any, Optional
+import operator
+from typing import Any, Callable, Iterable, List, Optional
 
 class MaxHeap:
     def __init__(self) -> None:
         self.data: list[Any] = [None]
 
+    @classmethod
+    def from_iterable(cls, items: Iterable[Any]) -> "MaxHeap":
+        """
+        원소들로 최대 힙을 O(n)에 만든다. (bottom-up heapify)
+
+        원소를 그대로 배열에 담은 뒤, 자식이 있는 마지막 노드(n // 2)부터
+        루트(1)까지 거꾸로 maxHeapify를 호출한다. 아래쪽 노드일수록 내려갈 거리가
+        짧으므로 전체 비용은 insert를 n번 호출하는 O(n log n)보다 작은 O(n)이다.
+
+        Args:
+            items (Iterable[Any]): 힙에 담을 데이터
+
+        Returns:
+            MaxHeap: 만들어진 최대 힙
+        """
+        heap = cls()
+        heap.data.extend(items)
+
+        for i in range((len(heap.data) - 1) // 2, 0, -1):
+            heap.maxHeapify(i)
+
+        return heap
+
     def insert(self, item: Any) -> None:
         """
         힙에 새로운 원소를 삽입한다.
@@ -61,3 +85,533 @@ class MaxHeap:
         if smallest != i:
             self.data[i], self.data[smallest] = self.data[smallest], self.data[i]
             self.maxHeapify(smallest)
+
+    def pushpop(self, item: Any) -> Any:
+        """
+        item을 삽입한 뒤 최댓값을 제거하여 반환한다.
+
+        insert 후 remove를 부르는 것과 결과는 같지만, item이 현재 최댓값 이상이면
+        힙을 건드리지 않고 바로 item을 돌려주고, 그렇지 않으면 루트를 item으로
+        바꾼 뒤 한 번만 아래로 내려 보낸다(maxHeapify).
+
+        Args:
+            item (Any): 삽입할 데이터
+
+        Returns:
+            Any: 제거된 최댓값 (item 자신일 수 있다)
+        """
+        if len(self.data) > 1 and self.data[1] > item:
+            item, self.data[1] = self.data[1], item
+            self.maxHeapify(1)
+
+        return item
+
+    def replace(self, item: Any) -> Optional[Any]:
+        """
+        최댓값을 제거하여 반환하고 item을 삽입한다.
+
+        remove 후 insert를 부르는 것과 결과는 같지만, 루트 자리에 item을 넣고
+        한 번만 아래로 내려 보낸다. pushpop과 달리 item이 더 커도 먼저 기존
+        최댓값을 꺼낸다.
+
+        Args:
+            item (Any): 삽입할 데이터
+
+        Returns:
+            Optional[Any]: 제거된 최댓값,
+                            만약 힙이 비어있었다면 None (item만 삽입된다)
+        """
+        if len(self.data) == 1:
+            self.data.append(item)
+            return None
+
+        data, self.data[1] = self.data[1], item
+        self.maxHeapify(1)
+        return data
+
+
+class HeapHandle:
+    def __init__(self, item: Any, priority: Any, index: int):
+        """
+        IndexedMaxHeap에 들어 있는 원소 하나를 가리키는 핸들을 초기화한다.
+
+        Args:
+            item (Any): 원소 데이터
+            priority (Any): 원소의 우선순위 (비교 기준)
+            index (int): 힙 배열에서의 현재 위치, 힙에서 빠지면 0
+        """
+        self.item = item
+        self.priority = priority
+        self.index = index
+
+
+class IndexedMaxHeap:
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None) -> None:
+        """
+        원소의 위치를 추적하여 임의 원소의 우선순위 변경/삭제를 지원하는 최대 힙을 초기화한다.
+
+        MaxHeap과 같이 data[0]을 비워 둔 1-based 배열을 사용하되, 배열에는
+        HeapHandle을 담고 각 핸들이 자신의 위치(index)를 기억한다. 원소가
+        이동할 때마다 index를 갱신하므로 핸들만으로 O(1)에 위치를 찾을 수 있다.
+
+        우선순위끼리만 비교하므로 원소 데이터 자체는 비교 가능하지 않아도 된다.
+
+        Args:
+            key (Callable or None): 원소에서 우선순위를 계산하는 함수.
+                                    None이면 원소 자신을 우선순위로 사용한다.
+        """
+        self.data: list[Any] = [None]
+        self.key = key
+
+    def size(self) -> int:
+        """
+        힙에 들어 있는 원소 개수를 반환한다.
+
+        Returns:
+            int: 원소 개수
+        """
+        return len(self.data) - 1
+
+    def isEmpty(self) -> bool:
+        """
+        힙이 비어있는지 여부를 반환한다.
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return self.size() == 0
+
+    def peek(self) -> Optional[Any]:
+        """
+        최대 우선순위 원소를 제거하지 않고 반환한다.
+
+        Returns:
+            Optional[Any]: 최대 우선순위 원소, 힙이 비어있다면 None
+        """
+        return self.data[1].item if len(self.data) > 1 else None
+
+    def insert(self, item: Any, priority: Any = None) -> HeapHandle:
+        """
+        힙에 새로운 원소를 삽입하고 그 원소의 핸들을 반환한다.
+
+        Args:
+            item (Any): 힙에 삽입할 데이터
+            priority (Any): 우선순위. None이면 key(item) (key가 없으면 item)을 사용한다.
+
+        Returns:
+            HeapHandle: update/remove에 사용할 핸들
+        """
+        if priority is None:
+            priority = self.key(item) if self.key else item
+
+        handle = HeapHandle(item, priority, len(self.data))
+        self.data.append(handle)
+        self._siftUp(handle.index)
+        return handle
+
+    def remove(self, handle: Optional[HeapHandle] = None) -> Optional[Any]:
+        """
+        원소를 제거하고 반환한다. O(log n)
+
+        handle이 없으면 최대 우선순위 원소를, 있으면 그 핸들의 원소를 제거한다.
+        제거한 자리에는 마지막 원소를 옮겨 놓고, 그 원소를 위 또는 아래로 이동시켜
+        힙 성질을 복구한다.
+
+        Args:
+            handle (HeapHandle or None): 제거할 원소의 핸들
+
+        Returns:
+            Optional[Any]: 제거된 원소,
+                            handle 없이 호출했는데 힙이 비어있다면 None
+
+        Raises:
+            ValueError: handle이 이 힙에 들어 있지 않으면 발생
+        """
+        if handle is None:
+            if len(self.data) == 1:
+                return None
+            handle = self.data[1]
+        else:
+            self._check(handle)
+
+        i = handle.index
+        last = self.data.pop()
+
+        if last is not handle:
+            self.data[i] = last
+            last.index = i
+            self._siftUp(i)
+            self._siftDown(last.index)
+
+        handle.index = 0
+        return handle.item
+
+    def update(self, handle: HeapHandle, priority: Any) -> None:
+        """
+        원소의 우선순위를 바꾸고 힙 성질을 복구한다. O(log n)
+
+        우선순위가 커졌으면 위로, 작아졌으면 아래로 이동시킨다.
+
+        Args:
+            handle (HeapHandle): 우선순위를 바꿀 원소의 핸들
+            priority (Any): 새 우선순위
+
+        Raises:
+            ValueError: handle이 이 힙에 들어 있지 않으면 발생
+        """
+        self._check(handle)
+
+        old = handle.priority
+        handle.priority = priority
+
+        if old < priority:
+            self._siftUp(handle.index)
+        else:
+            self._siftDown(handle.index)
+
+    def _check(self, handle: HeapHandle) -> None:
+        """
+        handle이 이 힙의 현재 원소를 가리키는지 확인한다.
+
+        Args:
+            handle (HeapHandle): 확인할 핸들
+
+        Raises:
+            ValueError: handle이 이 힙에 들어 있지 않으면 발생
+        """
+        i = handle.index
+        if not (0 < i < len(self.data) and self.data[i] is handle):
+            raise ValueError("handle is not in this heap")
+
+    def _siftUp(self, i: int) -> None:
+        """
+        인덱스 i의 원소를 부모보다 작아질 때까지 위로 올린다.
+
+        Args:
+            i (int): 이동을 시작할 인덱스
+        """
+        data = self.data
+        handle = data[i]
+
+        while i > 1:
+            parent = i // 2
+            if not (data[parent].priority < handle.priority):
+                break
+            data[i] = data[parent]
+            data[i].index = i
+            i = parent
+
+        data[i] = handle
+        handle.index = i
+
+    def _siftDown(self, i: int) -> None:
+        """
+        인덱스 i의 원소를 두 자식보다 커질 때까지 아래로 내린다.
+
+        Args:
+            i (int): 이동을 시작할 인덱스
+        """
+        data = self.data
+        n = len(data)
+        handle = data[i]
+
+        while 2 * i < n:
+            child = 2 * i
+            if child + 1 < n and data[child].priority < data[child + 1].priority:
+                child += 1
+            if not (handle.priority < data[child].priority):
+                break
+            data[i] = data[child]
+            data[i].index = i
+            i = child
+
+        data[i] = handle
+        handle.index = i
+
+
+class DaryHeap:
+    def __init__(self, d: int = 4, max_heap: bool = True) -> None:
+        """
+        자식을 d개씩 가지는 d-ary 힙을 초기화한다.
+
+        0번부터 채우는 배열을 사용하며, i번 노드의 자식은 d*i+1 ~ d*i+d,
+        부모는 (i-1)//d 에 있다. 트리 높이가 log_d(n)이므로 d가 클수록 remove에서
+        내려가는 레벨 수가 줄어든다. (대신 레벨마다 자식 d개를 비교한다)
+
+        원소를 옮길 때는 두 원소를 맞바꾸지 않고, 이동할 원소를 들고 있는 채로
+        빈 자리(hole)만 옮긴 뒤 마지막에 한 번 써 넣는다.
+
+        Args:
+            d (int): 자식 수 (2 이상)
+            max_heap (bool): True이면 최대 힙, False이면 최소 힙
+
+        Raises:
+            ValueError: d가 2 미만이면 발생
+        """
+        if d < 2:
+            raise ValueError("d must be at least 2")
+
+        self.d: int = d
+        self.data: list[Any] = []
+        # before(a, b)가 True이면 a가 b보다 루트에 가까워야 한다.
+        self.before: Callable[[Any, Any], bool] = operator.gt if max_heap else operator.lt
+
+    def size(self) -> int:
+        """
+        힙에 들어 있는 원소 개수를 반환한다.
+
+        Returns:
+            int: 원소 개수
+        """
+        return len(self.data)
+
+    def isEmpty(self) -> bool:
+        """
+        힙이 비어있는지 여부를 반환한다.
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return len(self.data) == 0
+
+    def peek(self) -> Optional[Any]:
+        """
+        루트 원소(최대 힙이면 최댓값, 최소 힙이면 최솟값)를 제거하지 않고 반환한다.
+
+        Returns:
+            Optional[Any]: 루트 원소, 힙이 비어있다면 None
+        """
+        return self.data[0] if self.data else None
+
+    def insert(self, item: Any) -> None:
+        """
+        힙에 새로운 원소를 삽입한다.
+
+        Args:
+            item (Any): 힙에 삽입할 데이터
+        """
+        self.data.append(item)
+        self._siftUp(len(self.data) - 1)
+
+    def remove(self) -> Optional[Any]:
+        """
+        루트 원소를 제거하고 반환한다.
+
+        Returns:
+            Optional[Any]: 제거된 루트 원소,
+                            만약 힙이 비어있다면 None
+        """
+        if not self.data:
+            return None
+
+        last = self.data.pop()
+        if not self.data:
+            return last
+
+        root = self.data[0]
+        self.data[0] = last
+        self._siftDown(0)
+        return root
+
+    def replace(self, item: Any) -> Optional[Any]:
+        """
+        루트 원소를 제거하여 반환하고 item을 삽입한다. (한 번의 siftDown)
+
+        Args:
+            item (Any): 삽입할 데이터
+
+        Returns:
+            Optional[Any]: 제거된 루트 원소,
+                            만약 힙이 비어있었다면 None (item만 삽입된다)
+        """
+        if not self.data:
+            self.data.append(item)
+            return None
+
+        root = self.data[0]
+        self.data[0] = item
+        self._siftDown(0)
+        return root
+
+    def heapify(self) -> None:
+        """
+        data 배열을 직접 바꾼 뒤 힙 성질을 O(n)에 다시 복구한다. (bottom-up heapify)
+
+        자식이 있는 마지막 노드부터 루트까지 거꾸로 _siftDown을 호출한다.
+        """
+        for i in range((len(self.data) - 2) // self.d, -1, -1):
+            self._siftDown(i)
+
+    def _siftUp(self, i: int) -> None:
+        """
+        인덱스 i의 원소를 부모보다 앞서지 않을 때까지 위로 올린다.
+
+        Args:
+            i (int): 이동을 시작할 인덱스
+        """
+        data, d, before = self.data, self.d, self.before
+        item = data[i]
+
+        while i > 0:
+            parent = (i - 1) // d
+            if not before(item, data[parent]):
+                break
+            data[i] = data[parent]
+            i = parent
+
+        data[i] = item
+
+    def _siftDown(self, i: int) -> None:
+        """
+        인덱스 i의 원소를 자식들보다 뒤처지지 않을 때까지 반복문으로 아래로 내린다.
+
+        Args:
+            i (int): 이동을 시작할 인덱스
+        """
+        data, d, before = self.data, self.d, self.before
+        n = len(data)
+        item = data[i]
+
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+
+            # 자식들 중 루트에 가장 가까워야 하는 것을 찾는다.
+            best = first
+            for child in range(first + 1, min(first + d, n)):
+                if before(data[child], data[best]):
+                    best = child
+
+            if not before(data[best], item):
+                break
+
+            data[i] = data[best]
+            i = best
+
+        data[i] = item
+
+
+class TopKSelector:
+    def __init__(self, k: int, key: Optional[Callable[[Any], Any]] = None, largest: bool = True) -> None:
+        """
+        데이터를 흘려보내며 가장 큰(또는 작은) k개만 남기는 선택기를 초기화한다.
+
+        지금까지의 후보 k개를 힙으로 유지하되, 루트에는 후보 중 가장 약한 원소
+        (largest이면 최솟값, 아니면 최댓값)를 둔다. 새 원소는 루트와 한 번만
+        비교해서 후보가 아니면 바로 버리고, 후보이면 replace로 루트와 교체한다.
+        따라서 메모리는 O(k)이고, 대부분의 원소는 비교 한 번으로 처리된다.
+
+        key가 있으면 힙에 (키, 순번, 원소)를 넣어 원소끼리는 비교하지 않는다.
+        키가 같은 원소들은 먼저 들어온 것이 남는다.
+
+        Args:
+            k (int): 남길 원소 수 (0 이상)
+            key (Callable or None): 비교에 사용할 키를 계산하는 함수
+            largest (bool): True이면 가장 큰 k개, False이면 가장 작은 k개를 남긴다.
+
+        Raises:
+            ValueError: k가 음수이면 발생
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+
+        self.k: int = k
+        self.key = key
+        self.largest: bool = largest
+        self.count: int = 0  # 지금까지 받은 원소 수 (순번으로 사용)
+        self.heap = DaryHeap(4, max_heap=not largest)
+
+    def push(self, item: Any) -> None:
+        """
+        원소 하나를 후보로 넣어 본다.
+
+        Args:
+            item (Any): 넣을 데이터
+        """
+        self.extend((item,))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        여러 원소(한 묶음)를 차례로 후보로 넣어 본다. 여러 번 나눠 호출해도 된다.
+
+        Args:
+            items (Iterable[Any]): 넣을 데이터
+        """
+        k, key, heap = self.k, self.key, self.heap
+        data = heap.data
+        better = operator.gt if self.largest else operator.lt
+
+        count = self.count
+
+        if k == 0:
+            for _ in items:
+                count += 1
+        elif key is None:
+            for item in items:
+                count += 1
+                if len(data) < k:
+                    heap.insert(item)
+                elif better(item, data[0]):
+                    heap.replace(item)
+        else:
+            # 키가 같을 때 먼저 들어온 원소가 앞서도록 순번의 부호를 정한다.
+            sign = -1 if self.largest else 1
+
+            for item in items:
+                count += 1
+                kv = key(item)
+                if len(data) < k:
+                    heap.insert((kv, sign * count, item))
+                elif better(kv, data[0][0]):
+                    heap.replace((kv, sign * count, item))
+
+        self.count = count
+
+    def result(self) -> List[Any]:
+        """
+        지금까지 남은 후보를 정렬하여 반환한다. (largest이면 내림차순, 아니면 오름차순)
+
+        Returns:
+            list: 최대 k개의 원소
+        """
+        entries = sorted(self.heap.data, reverse=self.largest)
+
+        if self.key is None:
+            return entries
+
+        return [entry[2] for entry in entries]
+
+
+def top_k(iterable: Iterable[Any], k: int, key: Optional[Callable[[Any], Any]] = None) -> List[Any]:
+    """
+    iterable에서 가장 큰 k개를 O(k) 메모리로 골라 내림차순으로 반환한다.
+
+    Args:
+        iterable (Iterable[Any]): 데이터 (제너레이터 가능)
+        k (int): 고를 원소 수
+        key (Callable or None): 비교에 사용할 키를 계산하는 함수
+
+    Returns:
+        list: 가장 큰 k개의 원소 (내림차순)
+    """
+    selector = TopKSelector(k, key, largest=True)
+    selector.extend(iterable)
+    return selector.result()
+
+
+def bottom_k(iterable: Iterable[Any], k: int, key: Optional[Callable[[Any], Any]] = None) -> List[Any]:
+    """
+    iterable에서 가장 작은 k개를 O(k) 메모리로 골라 오름차순으로 반환한다.
+
+    Args:
+        iterable (Iterable[Any]): 데이터 (제너레이터 가능)
+        k (int): 고를 원소 수
+        key (Callable or None): 비교에 사용할 키를 계산하는 함수
+
+    Returns:
+        list: 가장 작은 k개의 원소 (오름차순)
+    """
+    selector = TopKSelector(k, key, largest=False)
+    selector.extend(iterable)
+    return selector.result()
@@ -0,0 +1,221 @@
+import operator
+from typing import Any, Callable, List, Optional
+
+
+def _isMinLevel(i: int) -> bool:
+    """
+    i번 노드가 최소 레벨(짝수 깊이)에 있는지 여부를 반환한다.
+
+    Args:
+        i (int): 노드 인덱스 (0부터 시작)
+
+    Returns:
+        bool: 최소 레벨이면 True, 최대 레벨이면 False
+    """
+    return (i + 1).bit_length() % 2 == 1
+
+
+class MinMaxHeap:
+    def __init__(self) -> None:
+        """
+        최솟값과 최댓값을 모두 꺼낼 수 있는 최소-최대 힙(min-max heap)을 초기화한다.
+
+        0번부터 채우는 배열을 사용하며, 짝수 깊이(루트 포함)는 최소 레벨,
+        홀수 깊이는 최대 레벨이다.
+        - 최소 레벨의 노드는 자기 서브트리에서 가장 작은 값이다.
+        - 최대 레벨의 노드는 자기 서브트리에서 가장 큰 값이다.
+        따라서 최솟값은 루트, 최댓값은 루트의 두 자식 중 큰 쪽에 있다.
+
+        - peek_min, peek_max: O(1)
+        - insert, pop_min, pop_max: O(log n)
+
+        최소 힙과 최대 힙 두 개를 함께 유지하지 않고 배열 하나로 양쪽 끝을 모두 다룬다.
+        """
+        self.data: List[Any] = []
+
+    def size(self) -> int:
+        """
+        힙에 들어 있는 원소 개수를 반환한다.
+
+        Returns:
+            int: 원소 개수
+        """
+        return len(self.data)
+
+    def isEmpty(self) -> bool:
+        """
+        힙이 비어있는지 여부를 반환한다.
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return len(self.data) == 0
+
+    def peek_min(self) -> Optional[Any]:
+        """
+        최솟값을 제거하지 않고 반환한다.
+
+        Returns:
+            Optional[Any]: 최솟값, 힙이 비어있다면 None
+        """
+        return self.data[0] if self.data else None
+
+    def peek_max(self) -> Optional[Any]:
+        """
+        최댓값을 제거하지 않고 반환한다.
+
+        Returns:
+            Optional[Any]: 최댓값, 힙이 비어있다면 None
+        """
+        i = self._maxIndex()
+        return self.data[i] if i is not None else None
+
+    def _maxIndex(self) -> Optional[int]:
+        """
+        최댓값이 있는 인덱스를 반환한다. (루트 또는 루트의 자식 중 하나)
+
+        Returns:
+            Optional[int]: 최댓값의 인덱스, 힙이 비어있다면 None
+        """
+        n = len(self.data)
+        if n <= 2:
+            return n - 1 if n else None
+
+        return 1 if not (self.data[1] < self.data[2]) else 2
+
+    def insert(self, item: Any) -> None:
+        """
+        힙에 새로운 원소를 삽입한다.
+
+        맨 끝에 붙인 뒤, 부모와 비교해 최소 레벨 쪽으로 올라갈지 최대 레벨 쪽으로
+        올라갈지 정하고, 같은 종류의 레벨(조부모)끼리만 비교하며 올린다.
+
+        Args:
+            item (Any): 힙에 삽입할 데이터
+        """
+        self.data.append(item)
+        i = len(self.data) - 1
+        if i == 0:
+            return
+
+        parent = (i - 1) // 2
+        if _isMinLevel(i):
+            if self.data[parent] < item:
+                self.data[i] = self.data[parent]
+                self._siftUp(parent, item, operator.gt)
+            else:
+                self._siftUp(i, item, operator.lt)
+        else:
+            if item < self.data[parent]:
+                self.data[i] = self.data[parent]
+                self._siftUp(parent, item, operator.lt)
+            else:
+                self._siftUp(i, item, operator.gt)
+
+    def pop_min(self) -> Optional[Any]:
+        """
+        최솟값을 제거하고 반환한다.
+
+        Returns:
+            Optional[Any]: 제거된 최솟값,
+                            만약 힙이 비어있다면 None
+        """
+        if not self.data:
+            return None
+
+        return self._removeAt(0)
+
+    def pop_max(self) -> Optional[Any]:
+        """
+        최댓값을 제거하고 반환한다.
+
+        Returns:
+            Optional[Any]: 제거된 최댓값,
+                            만약 힙이 비어있다면 None
+        """
+        i = self._maxIndex()
+        if i is None:
+            return None
+
+        return self._removeAt(i)
+
+    def _removeAt(self, i: int) -> Any:
+        """
+        i번 원소를 제거하고 반환한다. 마지막 원소를 그 자리로 옮긴 뒤 아래로 내린다.
+
+        Args:
+            i (int): 제거할 인덱스 (루트 또는 루트의 자식)
+
+        Returns:
+            Any: 제거된 원소
+        """
+        item = self.data[i]
+        last = self.data.pop()
+
+        if i < len(self.data):
+            self._siftDown(i, last, operator.lt if _isMinLevel(i) else operator.gt)
+
+        return item
+
+    def _siftUp(self, i: int, item: Any, before: Callable[[Any, Any], bool]) -> None:
+        """
+        item을 i번 자리에서 시작해 조부모보다 before 관계가 아닐 때까지 올린다.
+
+        Args:
+            i (int): 빈 자리(hole)의 인덱스
+            item (Any): 올릴 원소
+            before (Callable): 최소 레벨이면 operator.lt, 최대 레벨이면 operator.gt
+        """
+        data = self.data
+
+        while i >= 3:
+            grandparent = (i - 3) // 4
+            if not before(item, data[grandparent]):
+                break
+            data[i] = data[grandparent]
+            i = grandparent
+
+        data[i] = item
+
+    def _siftDown(self, i: int, item: Any, before: Callable[[Any, Any], bool]) -> None:
+        """
+        item을 i번 자리에서 시작해 자손들 중 알맞은 자리까지 내린다.
+
+        자식과 손자 중 before 기준으로 가장 앞서는 원소 m을 찾는다.
+        - m이 손자이고 item보다 앞서면 m을 올리고 그 자리에서 계속 내린다.
+          이때 item이 m의 부모(반대 종류의 레벨)와 순서가 어긋나면 둘을 맞바꾼다.
+        - m이 자식이면 (더 내려갈 손자가 없으므로) 필요할 때 한 번만 맞바꾸고 멈춘다.
+
+        Args:
+            i (int): 빈 자리(hole)의 인덱스
+            item (Any): 내릴 원소
+            before (Callable): 최소 레벨이면 operator.lt, 최대 레벨이면 operator.gt
+        """
+        data = self.data
+        n = len(data)
+
+        while 2 * i + 1 < n:
+            first_child = 2 * i + 1
+            first_grandchild = 4 * i + 3
+
+            m = first_child
+            candidates = [first_child + 1] + list(range(first_grandchild, min(first_grandchild + 4, n)))
+            for j in candidates:
+                if j < n and before(data[j], data[m]):
+                    m = j
+
+            if not before(data[m], item):
+                break
+
+            data[i] = data[m]
+
+            if m < first_grandchild:
+                i = m
+                break
+
+            parent = (m - 1) // 2
+            if before(data[parent], item):
+                item, data[parent] = data[parent], item
+            i = m
+
+        data[i] = item
@@ -0,0 +1,303 @@
+import math
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+
+class NumericHeap:
+    def __init__(self, capacity: int = 16, dtype: Any = np.float64) -> None:
+        """
+        숫자 우선순위 전용 최대 힙을 초기화한다.
+
+        우선순위는 연속된 NumPy 배열(priorities)에, 각 원소의 식별자(payload id)는
+        같은 위치의 정수 배열(ids)에 저장한다. 0번부터 채우며 i번 노드의 자식은
+        2i+1, 2i+2 이다. 배열이 가득 차면 두 배로 늘린다.
+
+        파이썬 객체 대신 숫자를 배열에 담아 두므로, 대량 삽입/삭제(push_many,
+        pop_many)는 원소마다 인터프리터에서 비교하지 않고 벡터 연산으로 처리한다.
+
+        Args:
+            capacity (int): 초기 배열 크기 (1 이상)
+            dtype (Any): 우선순위 배열의 NumPy 자료형
+        """
+        capacity = max(capacity, 1)
+        self.priorities: np.ndarray = np.empty(capacity, dtype=dtype)
+        self.ids: np.ndarray = np.empty(capacity, dtype=np.int64)
+        self.count: int = 0
+        self.next_id: int = 0  # id를 주지 않았을 때 자동으로 붙일 다음 번호
+
+    def size(self) -> int:
+        """
+        힙에 들어 있는 원소 개수를 반환한다.
+
+        Returns:
+            int: 원소 개수
+        """
+        return self.count
+
+    def isEmpty(self) -> bool:
+        """
+        힙이 비어있는지 여부를 반환한다.
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return self.count == 0
+
+    def _reserve(self, needed: int) -> None:
+        """
+        원소 needed개를 담을 수 있도록 배열을 (최소 두 배로) 늘린다.
+
+        Args:
+            needed (int): 필요한 전체 원소 수
+        """
+        capacity = len(self.priorities)
+        if needed <= capacity:
+            return
+
+        capacity = max(needed, capacity * 2)
+        priorities = np.empty(capacity, dtype=self.priorities.dtype)
+        ids = np.empty(capacity, dtype=np.int64)
+        priorities[:self.count] = self.priorities[:self.count]
+        ids[:self.count] = self.ids[:self.count]
+        self.priorities = priorities
+        self.ids = ids
+
+    def _new_ids(self, m: int) -> np.ndarray:
+        """
+        자동 id m개를 만든다.
+
+        Args:
+            m (int): 만들 id 개수
+
+        Returns:
+            np.ndarray: 연속된 id 배열
+        """
+        ids = np.arange(self.next_id, self.next_id + m, dtype=np.int64)
+        self.next_id += m
+        return ids
+
+    def peek(self) -> Optional[Tuple[Any, int]]:
+        """
+        최대 우선순위 원소를 제거하지 않고 반환한다.
+
+        Returns:
+            Optional[tuple]: (우선순위, id), 힙이 비어있다면 None
+        """
+        if self.count == 0:
+            return None
+
+        return self.priorities[0].item(), int(self.ids[0])
+
+    def insert(self, priority: Any, item_id: Optional[int] = None) -> int:
+        """
+        원소 하나를 삽입한다. O(log n)
+
+        Args:
+            priority (Any): 우선순위 (숫자)
+            item_id (int or None): 원소의 식별자. None이면 자동으로 붙인다.
+
+        Returns:
+            int: 삽입한 원소의 id
+        """
+        if item_id is None:
+            item_id = int(self._new_ids(1)[0])
+
+        self._reserve(self.count + 1)
+        self.priorities[self.count] = priority
+        self.ids[self.count] = item_id
+        self.count += 1
+        self._siftUp(self.count - 1)
+        return item_id
+
+    def remove(self) -> Optional[Tuple[Any, int]]:
+        """
+        최대 우선순위 원소를 제거하고 반환한다. O(log n)
+
+        Returns:
+            Optional[tuple]: (우선순위, id),
+                             만약 힙이 비어있다면 None
+        """
+        if self.count == 0:
+            return None
+
+        top = self.peek()
+        self.count -= 1
+
+        if self.count > 0:
+            self.priorities[0] = self.priorities[self.count]
+            self.ids[0] = self.ids[self.count]
+            self._siftDown(0)
+
+        return top
+
+    def push_many(self, priorities: Any, ids: Any = None) -> np.ndarray:
+        """
+        여러 원소를 한 번에 삽입한다.
+
+        새 원소들을 배열 끝에 한 번에 복사한 뒤,
+        - 묶음이 작으면(m log n < n) 새 원소마다 siftUp 하고,
+        - 묶음이 크면 배열 전체를 벡터 연산으로 다시 힙으로 만든다. (O(n + m))
+
+        Args:
+            priorities (array-like): 우선순위들
+            ids (array-like or None): 같은 길이의 id들. None이면 자동으로 붙인다.
+
+        Returns:
+            np.ndarray: 삽입한 원소들의 id
+
+        Raises:
+            ValueError: priorities와 ids의 길이가 다르면 발생
+        """
+        priorities = np.asarray(priorities, dtype=self.priorities.dtype).ravel()
+        m = len(priorities)
+
+        if ids is None:
+            ids = self._new_ids(m)
+        else:
+            ids = np.asarray(ids, dtype=np.int64).ravel()
+            if len(ids) != m:
+                raise ValueError("priorities and ids must have the same length")
+
+        if m == 0:
+            return ids
+
+        start = self.count
+        self._reserve(start + m)
+        self.priorities[start:start + m] = priorities
+        self.ids[start:start + m] = ids
+        self.count += m
+
+        if m * math.log2(self.count + 1) < self.count:
+            for i in range(start, self.count):
+                self._siftUp(i)
+        else:
+            self._heapify()
+
+        return ids
+
+    def pop_many(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        우선순위가 가장 큰 원소 k개를 한 번에 제거하여 내림차순으로 반환한다.
+
+        - k가 작으면(k log n < n) remove를 k번 반복한다.
+        - k가 크면 argpartition으로 상위 k개를 고르고(부분 정렬), 그 k개만 정렬한다.
+          남은 원소들은 앞쪽으로 모은 뒤 벡터 연산으로 다시 힙으로 만든다. (O(n + k log k))
+
+        Args:
+            k (int): 꺼낼 원소 수. 힙의 크기보다 크면 전부 꺼낸다.
+
+        Returns:
+            tuple: (우선순위 배열, id 배열) - 우선순위 내림차순
+        """
+        k = max(0, min(k, self.count))
+        n = self.count
+
+        if k * math.log2(n + 1) < n:
+            priorities = np.empty(k, dtype=self.priorities.dtype)
+            ids = np.empty(k, dtype=np.int64)
+            for i in range(k):
+                popped = self.remove()
+                assert popped is not None  # k <= count 이므로 None일 수 없다.
+                priorities[i], ids[i] = popped
+            return priorities, ids
+
+        live = self.priorities[:n]
+        top = np.argpartition(live, n - k)[n - k:]
+        top = top[np.argsort(live[top], kind="stable")[::-1]]
+        priorities = live[top]
+        ids = self.ids[top]
+
+        keep = np.ones(n, dtype=bool)
+        keep[top] = False
+        rest = n - k
+        self.priorities[:rest] = live[keep]
+        self.ids[:rest] = self.ids[:n][keep]
+        self.count = rest
+        self._heapify()
+
+        return priorities, ids
+
+    def _siftUp(self, i: int) -> None:
+        """
+        인덱스 i의 원소를 부모보다 작아질 때까지 위로 올린다.
+
+        Args:
+            i (int): 이동을 시작할 인덱스
+        """
+        p, ids = self.priorities, self.ids
+        priority, item_id = p[i], ids[i]
+
+        while i > 0:
+            parent = (i - 1) // 2
+            if not (p[parent] < priority):
+                break
+            p[i] = p[parent]
+            ids[i] = ids[parent]
+            i = parent
+
+        p[i] = priority
+        ids[i] = item_id
+
+    def _siftDown(self, i: int) -> None:
+        """
+        인덱스 i의 원소를 두 자식보다 커질 때까지 아래로 내린다.
+
+        Args:
+            i (int): 이동을 시작할 인덱스
+        """
+        p, ids, n = self.priorities, self.ids, self.count
+        priority, item_id = p[i], ids[i]
+
+        while 2 * i + 1 < n:
+            child = 2 * i + 1
+            if child + 1 < n and p[child] < p[child + 1]:
+                child += 1
+            if not (priority < p[child]):
+                break
+            p[i] = p[child]
+            ids[i] = ids[child]
+            i = child
+
+        p[i] = priority
+        ids[i] = item_id
+
+    def _heapify(self) -> None:
+        """
+        배열 전체를 벡터 연산으로 최대 힙으로 만든다. (bottom-up heapify)
+
+        자식이 있는 가장 깊은 레벨부터 루트 레벨까지 올라가며, 같은 레벨의 노드들을
+        한꺼번에 아래로 내린다. 같은 레벨의 노드들은 서로 겹치지 않는 서브트리를
+        가지므로 동시에 옮겨도 충돌하지 않는다. 전체 작업량은 O(n)이고,
+        NumPy 호출 횟수는 O(log^2 n)이다.
+        """
+        p, ids, n = self.priorities, self.ids, self.count
+        if n < 2:
+            return
+
+        last_parent = n // 2 - 1
+        top_level = int(math.log2(last_parent + 1))
+
+        for level in range(top_level, -1, -1):
+            start = (1 << level) - 1
+            stop = min((1 << (level + 1)) - 1, last_parent + 1)
+            nodes = np.arange(start, stop)
+
+            while nodes.size:
+                left = 2 * nodes + 1
+                right = left + 1
+
+                # 두 자식 중 우선순위가 큰 쪽을 고른다.
+                child = left.copy()
+                has_right = right < n
+                pick_right = np.zeros(len(nodes), dtype=bool)
+                pick_right[has_right] = p[right[has_right]] > p[left[has_right]]
+                child[pick_right] = right[pick_right]
+
+                # 자식이 더 큰 노드만 자식과 맞바꾸고 한 레벨 더 내려간다.
+                swap = p[child] > p[nodes]
+                nodes, child = nodes[swap], child[swap]
+                p[nodes], p[child] = p[child], p[nodes]
+                ids[nodes], ids[child] = ids[child], ids[nodes]
+
+                nodes = child[2 * child + 1 < n]
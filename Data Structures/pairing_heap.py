@@ -0,0 +1,150 @@
+from typing import Any, List, Optional
+
+
+class Node:
+    def __init__(self, item: Any):
+        """
+        페어링 힙을 구성하는 노드를 초기화한다.
+
+        자식이 여러 개일 수 있으므로 첫 자식(child)만 가리키고,
+        나머지 자식들은 sibling으로 이어진 단일 연결 리스트로 표현한다.
+
+        Args:
+            item (Any): 노드에 저장할 데이터
+        """
+        self.data = item
+        self.child: Optional["Node"] = None
+        self.sibling: Optional["Node"] = None
+
+
+def _link(a: Node, b: Node) -> Node:
+    """
+    두 힙(루트 a, b)을 하나로 합친다. 작은 루트를 큰 루트의 첫 자식으로 붙인다.
+
+    Args:
+        a (Node): 한 힙의 루트
+        b (Node): 다른 힙의 루트
+
+    Returns:
+        Node: 합쳐진 힙의 루트
+    """
+    if a.data < b.data:
+        a, b = b, a
+
+    b.sibling = a.child
+    a.child = b
+    return a
+
+
+class PairingHeap:
+    def __init__(self) -> None:
+        """
+        O(1)에 두 힙을 합칠 수 있는 최대 페어링 힙을 초기화한다.
+
+        - insert, meld, peek: O(1)
+        - remove: 분할 상환 O(log n)
+
+        배열 기반 MaxHeap은 두 힙을 합치려면 한쪽 원소를 모두 다시 넣어야 하지만,
+        페어링 힙은 두 루트를 비교해 한쪽을 다른 쪽의 자식으로 붙이기만 하면 된다.
+        """
+        self.root: Optional[Node] = None
+        self.count: int = 0
+
+    def size(self) -> int:
+        """
+        힙에 들어 있는 원소 개수를 반환한다.
+
+        Returns:
+            int: 원소 개수
+        """
+        return self.count
+
+    def isEmpty(self) -> bool:
+        """
+        힙이 비어있는지 여부를 반환한다.
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return self.count == 0
+
+    def peek(self) -> Optional[Any]:
+        """
+        최댓값을 제거하지 않고 반환한다.
+
+        Returns:
+            Optional[Any]: 최댓값, 힙이 비어있다면 None
+        """
+        return self.root.data if self.root else None
+
+    def insert(self, item: Any) -> None:
+        """
+        힙에 새로운 원소를 삽입한다. 원소 하나짜리 힙과 합치는 것과 같다.
+
+        Args:
+            item (Any): 힙에 삽입할 데이터
+        """
+        node = Node(item)
+        self.root = _link(self.root, node) if self.root else node
+        self.count += 1
+
+    def meld(self, other: "PairingHeap") -> None:
+        """
+        다른 페어링 힙의 모든 원소를 이 힙으로 O(1)에 옮긴다.
+
+        원소를 복사하지 않고 루트끼리 연결하므로, other는 빈 힙이 된다.
+
+        Args:
+            other (PairingHeap): 합칠 힙
+        """
+        if other is self or other.root is None:
+            return
+
+        self.root = _link(self.root, other.root) if self.root else other.root
+        self.count += other.count
+
+        other.root = None
+        other.count = 0
+
+    def remove(self) -> Optional[Any]:
+        """
+        최대 힙에서 최댓값을 제거하고 반환한다.
+
+        루트를 떼어낸 뒤 남은 자식 서브힙들을 두 단계로 합친다. (two-pass pairing)
+        1) 왼쪽부터 둘씩 짝지어 합친다.
+        2) 그 결과들을 오른쪽부터 차례로 하나로 합친다.
+        재귀 없이 리스트를 사용하므로 자식이 아무리 많아도 안전하다.
+
+        Returns:
+            Optional[Any]: 제거된 최댓값,
+                            만약 힙이 비어있다면 None
+        """
+        if self.root is None:
+            return None
+
+        data = self.root.data
+        child = self.root.child
+
+        pairs: List[Node] = []
+        while child:
+            first = child
+            second = child.sibling
+            if second is None:
+                first.sibling = None
+                pairs.append(first)
+                break
+
+            child = second.sibling
+            first.sibling = None
+            second.sibling = None
+            pairs.append(_link(first, second))
+
+        if pairs:
+            root = pairs.pop()
+            while pairs:
+                root = _link(pairs.pop(), root)
+            self.root = root
+        else:
+            self.root = None
+        self.count -= 1
+        return data
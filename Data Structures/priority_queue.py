@@ -1,5 +1,7 @@
-from typing import Any
+import threading
+from typing import Any, Iterable, List, Optional
 from doubly_linkedlist import Node, DoublyLinkedList
+from heaps import DaryHeap
 
 
 class PriorityQueue:
@@ -64,6 +66,35 @@ class PriorityQueue:
 
         self.queue.insertAfter(curr, newNode)
 
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        """
+        여러 원소를 한 번에 우선순위 큐에 삽입한다.
+
+        원소마다 head부터 다시 훑는 대신(O(n*m)), 묶음을 한 번 내림차순으로 정렬한 뒤
+        기존 리스트와 한 번의 선형 순회로 병합한다. (O(m log m + n + m))
+
+        같은 값끼리의 순서는 enqueue를 차례로 호출한 것과 같다.
+        (나중에 들어온 원소일수록 head 쪽에 놓인다)
+
+        Args:
+            items (Iterable[Any]): 삽입할 데이터들 (비교 연산(<)이 가능해야 함)
+
+        Returns:
+            None
+        """
+        # 안정 정렬이므로, 뒤집어서 내림차순 정렬하면 같은 값은 나중 원소가 앞에 온다.
+        batch = sorted(reversed(list(items)), reverse=True)
+        curr = self.queue.head  # 더미 head에서 시작
+
+        for x in batch:
+            # x는 직전에 넣은 원소 이하이므로 직전에 넣은 노드부터 이어서 찾는다.
+            while curr.next is not self.queue.tail and x < curr.next.data:
+                curr = curr.next
+
+            newNode = Node(x)
+            self.queue.insertAfter(curr, newNode)
+            curr = newNode
+
     def dequeue(self) -> Any:
         """
         우선순위 큐에서 원소를 제거하고 반환한다.
@@ -83,6 +114,39 @@ class PriorityQueue:
 
         return self.queue.popAt(self.queue.getLength())
 
+    def dequeue_many(self, n: int) -> List[Any]:
+        """
+        우선순위가 가장 낮은(가장 작은) 원소 n개를 한 번에 제거하고 반환한다.
+
+        popAt을 n번 호출하는 대신, 맨 뒤의 노드 n개를 한 번의 링크 조작으로 떼어낸다.
+
+        Args:
+            n (int): 꺼낼 원소 수. 큐의 크기보다 크면 전부 꺼낸다.
+
+        Returns:
+            list: 제거된 원소들 (dequeue 순서, 즉 작은 값부터)
+        """
+        k = max(0, min(n, self.size()))
+        if k == 0:
+            return []
+
+        # 떼어낼 구간의 바로 앞 노드 (전부 꺼낼 때는 더미 head)
+        prev = self.queue.getAt(self.size() - k)
+        if prev is None:
+            raise RuntimeError("Linked list is corrupted: getAt returned None")
+
+        result: List[Any] = []
+        curr = self.queue.tail.prev
+        while curr is not prev:
+            result.append(curr.data)
+            curr = curr.prev
+
+        prev.next = self.queue.tail
+        self.queue.tail.prev = prev
+        self.queue.nodeCount -= k
+
+        return result
+
     def peek(self) -> Any:
         """
         dequeue 대상 원소(가장 작은 값)를 제거하지 않고 반환한다.
@@ -102,3 +166,477 @@ class PriorityQueue:
             raise RuntimeError("Linked list is corrupted: getAt returned None")
 
         return node.data
+
+
+class QueueEntry:
+    def __init__(self, x: Any, seq: int):
+        """
+        HeapPriorityQueue의 힙에 들어가는 항목을 초기화한다.
+
+        Args:
+            x (Any): 저장할 데이터
+            seq (int): 삽입 순번 (같은 값끼리 순서를 정하는 데 사용)
+        """
+        self.x = x
+        self.seq = seq
+        self.alive: bool = True
+
+    def __lt__(self, other: "QueueEntry") -> bool:
+        """
+        x로 먼저 비교하고, x끼리 크고 작음이 없으면 삽입 순번으로 비교한다.
+
+        ==는 사용하지 않으므로 x는 <만 정의되어 있어도 같은 값끼리 FIFO가 지켜진다.
+
+        Args:
+            other (QueueEntry): 비교할 항목
+
+        Returns:
+            bool: self가 먼저 꺼내져야 하면 True
+        """
+        return self.x < other.x or (not other.x < self.x and self.seq < other.seq)
+
+
+class QueueHandle:
+    def __init__(self, entry: QueueEntry):
+        """
+        HeapPriorityQueue에 들어 있는 원소 하나를 가리키는 핸들을 초기화한다.
+
+        Args:
+            entry (QueueEntry): 힙에 들어 있는 항목
+        """
+        self.entry: Optional[QueueEntry] = entry
+
+
+class HeapPriorityQueue:
+    def __init__(self, compact_ratio: float = 0.5):
+        """
+        이진 최소 힙(heaps.DaryHeap, d=2)을 이용해 구현한 우선순위 큐를 초기화한다.
+
+        PriorityQueue와 같은 API로 가장 작은 값을 먼저 꺼내지만,
+        연결 리스트를 처음부터 훑는 대신 힙을 사용하므로
+        enqueue/dequeue는 O(log n), peek은 O(1)이다.
+
+        같은 값끼리는 먼저 들어온 원소가 먼저 나가도록(FIFO) 힙에는 x와 삽입 순번,
+        살아있음 여부를 담은 QueueEntry를 넣는다. 항목끼리는 <만으로 비교하며,
+        x끼리 크고 작음이 없을 때만 순번을 비교한다.
+
+        취소(cancel)는 항목을 힙에서 찾아 빼지 않고 죽은 것으로 표시만 하며(O(1)),
+        죽은 항목은 dequeue/peek에서 맨 위에 올라왔을 때 버린다(lazy deletion).
+        죽은 항목의 비율이 compact_ratio를 넘으면 살아있는 항목만 남겨 힙을 다시 만든다.
+
+        Args:
+            compact_ratio (float): 힙을 다시 만들 죽은 항목 비율의 기준 (0 초과 1 이하)
+
+        Raises:
+            ValueError: compact_ratio가 (0, 1] 범위를 벗어나면 발생
+        """
+        if not 0 < compact_ratio <= 1:
+            raise ValueError("compact_ratio must be in (0, 1]")
+
+        self.heap = DaryHeap(2, max_heap=False)
+        self.counter: int = 0  # 다음 원소에 붙일 삽입 순번
+        self.dead: int = 0     # 힙에 남아 있는 죽은 항목 수
+        self.compact_ratio: float = compact_ratio
+
+    def size(self) -> int:
+        """
+        우선순위 큐에 들어있는 (취소되지 않은) 원소의 개수를 반환한다.
+
+        Returns:
+            int: 큐 원소 개수
+        """
+        return self.heap.size() - self.dead
+
+    def isEmpty(self) -> bool:
+        """
+        우선순위 큐가 비어있는지 여부를 반환한다.
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return self.size() == 0
+
+    def _push(self, x: Any) -> QueueEntry:
+        """
+        새 항목 QueueEntry(x, 삽입 순번)를 힙에 넣고 반환한다.
+
+        Args:
+            x (Any): 삽입할 데이터
+
+        Returns:
+            QueueEntry: 힙에 넣은 항목
+        """
+        entry = QueueEntry(x, self.counter)
+        self.counter += 1
+        self.heap.insert(entry)
+        return entry
+
+    def _pruneTop(self) -> None:
+        """
+        힙 맨 위의 죽은 항목들을 버린다.
+        """
+        data = self.heap.data
+        while data and not data[0].alive:
+            self.heap.remove()
+            self.dead -= 1
+
+    def _kill(self, entry: QueueEntry) -> None:
+        """
+        항목을 죽은 것으로 표시하고, 죽은 항목이 너무 많으면 힙을 다시 만든다.
+
+        Args:
+            entry (QueueEntry): 죽일 항목
+        """
+        entry.alive = False
+        self.dead += 1
+        self._compact()
+
+    def _compact(self) -> None:
+        """
+        죽은 항목의 비율이 compact_ratio를 넘으면 살아있는 항목만 남기고 힙을 O(n)에 다시 만든다.
+
+        다시 만들 때마다 죽은 항목 수가 0이 되므로, 비용은 그동안의 취소/dequeue에
+        나누어 지불된다.
+        """
+        if self.dead <= self.compact_ratio * self.heap.size():
+            return
+
+        self.heap.data = [entry for entry in self.heap.data if entry.alive]
+        self.heap.heapify()
+        self.dead = 0
+
+    def enqueue(self, x: Any) -> QueueHandle:
+        """
+        원소 x를 우선순위 큐에 삽입하고 그 원소의 핸들을 반환한다. O(log n)
+
+        Args:
+            x (Any): 삽입할 데이터 (비교 연산(<)이 가능해야 함)
+
+        Returns:
+            QueueHandle: cancel/reprioritize에 사용할 핸들
+        """
+        return QueueHandle(self._push(x))
+
+    def cancel(self, handle: QueueHandle) -> bool:
+        """
+        핸들이 가리키는 원소를 큐에서 취소한다. O(1) (분할 상환)
+
+        Args:
+            handle (QueueHandle): enqueue가 반환한 핸들
+
+        Returns:
+            bool: 취소했으면 True, 이미 꺼냈거나 취소된 원소이면 False
+        """
+        entry = handle.entry
+        if entry is None or not entry.alive:
+            return False
+
+        handle.entry = None
+        self._kill(entry)
+        return True
+
+    def reprioritize(self, handle: QueueHandle, x: Any) -> bool:
+        """
+        핸들이 가리키는 원소를 새 값 x로 바꾼다. O(log n)
+
+        기존 항목은 죽은 것으로 표시하고 x로 새 항목을 넣으며, 핸들은 새 항목을
+        가리키게 된다. 같은 값 사이에서는 방금 바꾼 원소가 가장 나중 순서가 된다.
+
+        Args:
+            handle (QueueHandle): enqueue가 반환한 핸들
+            x (Any): 새 값
+
+        Returns:
+            bool: 바꿨으면 True, 이미 꺼냈거나 취소된 원소이면 False
+        """
+        entry = handle.entry
+        if entry is None or not entry.alive:
+            return False
+
+        handle.entry = self._push(x)
+        self._kill(entry)
+        return True
+
+    def dequeue(self) -> Any:
+        """
+        우선순위 큐에서 가장 작은 원소를 제거하고 반환한다. O(log n) (분할 상환)
+
+        Returns:
+            Any: 제거된 원소
+
+        Raises:
+            IndexError: 큐가 비어있으면 발생
+        """
+        if self.isEmpty():
+            raise IndexError("dequeue from empty priority queue")
+
+        self._pruneTop()
+        entry = self.heap.remove()
+        assert entry is not None  # 비어있지 않음을 확인했으므로 None일 수 없다.
+        entry.alive = False  # 꺼낸 원소의 핸들로는 더 이상 취소할 수 없다.
+        self._compact()
+        return entry.x
+
+    def peek(self) -> Any:
+        """
+        dequeue 대상 원소(가장 작은 값)를 제거하지 않고 반환한다.
+
+        Returns:
+            Any: dequeue 대상 원소
+
+        Raises:
+            IndexError: 큐가 비어있으면 발생
+        """
+        if self.isEmpty():
+            raise IndexError("peek from empty priority queue")
+
+        self._pruneTop()
+        entry = self.heap.peek()
+        assert entry is not None  # 비어있지 않음을 확인했으므로 None일 수 없다.
+        return entry.x
+
+
+class BoundedPriorityQueue(HeapPriorityQueue):
+    def __init__(self, capacity: int, compact_ratio: float = 0.5):
+        """
+        최대 capacity개의 원소만 유지하는 우선순위 큐를 초기화한다.
+
+        HeapPriorityQueue와 같이 가장 작은 값을 먼저 꺼내며, 가장 좋은(작은)
+        capacity개만 남긴다. 같은 항목들을 담은 최대 힙(worst)을 하나 더 두어
+        가장 나쁜(가장 나중에 꺼낼) 원소를 O(1)에 찾는다.
+        큐가 가득 찬 상태에서 enqueue하면
+        - 새 원소가 가장 나쁜 원소보다 작으면 가장 나쁜 원소를 내보내고(evicted) 넣는다.
+        - 그렇지 않으면 새 원소를 거절한다(rejected).
+        어느 경우든 O(log n)이며, 내보낸 원소는 취소와 같이 죽은 것으로만 표시한다.
+
+        Args:
+            capacity (int): 최대 원소 수 (1 이상)
+            compact_ratio (float): 힙을 다시 만들 죽은 항목 비율의 기준 (0 초과 1 이하)
+
+        Raises:
+            ValueError: capacity가 1 미만이거나 compact_ratio가 (0, 1] 범위를 벗어나면 발생
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        super().__init__(compact_ratio)
+        self.capacity: int = capacity
+        self.worst = DaryHeap(2, max_heap=True)
+        self.evicted: int = 0   # 가득 찬 상태에서 밀려난 원소 수
+        self.rejected: int = 0  # 가득 찬 상태에서 거절된 원소 수
+
+    def isFull(self) -> bool:
+        """
+        우선순위 큐가 가득 찼는지 여부를 반환한다.
+
+        Returns:
+            bool: 가득 찼으면 True, 아니면 False
+        """
+        return self.size() >= self.capacity
+
+    def _push(self, x: Any) -> QueueEntry:
+        """
+        새 항목을 두 힙에 모두 넣고 반환한다.
+
+        Args:
+            x (Any): 삽입할 데이터
+
+        Returns:
+            QueueEntry: 힙에 넣은 항목
+        """
+        entry = super()._push(x)
+        self.worst.insert(entry)
+        return entry
+
+    def _compact(self) -> None:
+        """
+        두 힙 각각에서 죽은 항목의 비율이 compact_ratio를 넘으면 살아있는 항목만 남기고 다시 만든다.
+
+        꺼낸 원소는 worst 힙에는 죽은 채로 남아 있으므로, worst 힙의 죽은 항목 수는
+        (worst 힙 크기 - 살아있는 원소 수)이다.
+        """
+        super()._compact()
+
+        if self.worst.size() - self.size() > self.compact_ratio * self.worst.size():
+            self.worst.data = [entry for entry in self.worst.data if entry.alive]
+            self.worst.heapify()
+
+    def _worstEntry(self) -> QueueEntry:
+        """
+        worst 힙 맨 위의 죽은 항목들을 버리고, 살아있는 가장 나쁜 항목을 반환한다.
+
+        Returns:
+            QueueEntry: 가장 나중에 꺼낼 항목
+        """
+        entry = self.worst.peek()
+        assert entry is not None  # 살아있는 원소가 있을 때만 호출한다.
+
+        while not entry.alive:
+            self.worst.remove()
+            entry = self.worst.peek()
+            assert entry is not None
+
+        return entry
+
+    def enqueue(self, x: Any) -> QueueHandle:
+        """
+        원소 x를 삽입하고 핸들을 반환한다. O(log n)
+
+        큐가 가득 차 있으면 x가 가장 나쁜 원소보다 작을 때만 그 원소를 내보내고 넣는다.
+        같은 값이면 기존 원소가 먼저 꺼내질 차례이므로 x를 거절한다.
+        거절된 원소에도 (이미 죽은) 핸들을 돌려주므로, 그 핸들로 cancel/reprioritize를
+        호출하면 False를 반환한다.
+
+        Args:
+            x (Any): 삽입할 데이터 (비교 연산(<)이 가능해야 함)
+
+        Returns:
+            QueueHandle: cancel/reprioritize에 사용할 핸들
+        """
+        if self.isFull():
+            worst = self._worstEntry()
+            if not (x < worst.x):
+                self.rejected += 1
+                rejected = QueueEntry(x, -1)
+                rejected.alive = False
+                return QueueHandle(rejected)
+
+            self._kill(worst)
+            self.evicted += 1
+
+        return QueueHandle(self._push(x))
+
+    def peek_worst(self) -> Any:
+        """
+        가장 나쁜(가장 나중에 꺼낼) 원소를 제거하지 않고 반환한다.
+
+        Returns:
+            Any: 가장 나쁜 원소
+
+        Raises:
+            IndexError: 큐가 비어있으면 발생
+        """
+        if self.isEmpty():
+            raise IndexError("peek from empty priority queue")
+
+        return self._worstEntry().x
+
+
+class BlockingPriorityQueue:
+    def __init__(self, maxsize: int = 0):
+        """
+        여러 스레드가 함께 쓸 수 있는 블로킹 우선순위 큐를 초기화한다.
+
+        내부 저장소는 HeapPriorityQueue이며, 락 하나와 그 락을 공유하는
+        조건 변수 두 개(not_empty, not_full)로 보호한다.
+        - get은 큐가 비어있으면 not_empty를 기다린다.
+        - put은 큐가 가득 차 있으면(maxsize > 0) not_full을 기다린다.
+        대기 중인 스레드는 원소가 들어오거나 빠질 때 notify로 깨어나므로
+        바쁜 대기(polling)를 하지 않는다.
+
+        Args:
+            maxsize (int): 최대 원소 수. 0 이하이면 제한이 없다.
+        """
+        self.queue = HeapPriorityQueue()
+        self.maxsize: int = maxsize
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def size(self) -> int:
+        """
+        우선순위 큐에 들어있는 원소의 개수를 반환한다.
+
+        Returns:
+            int: 큐 원소 개수
+        """
+        with self.lock:
+            return self.queue.size()
+
+    def isEmpty(self) -> bool:
+        """
+        우선순위 큐가 비어있는지 여부를 반환한다.
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return self.size() == 0
+
+    def _isFull(self) -> bool:
+        """
+        (락을 잡은 상태에서) 큐가 가득 찼는지 여부를 반환한다.
+
+        Returns:
+            bool: 가득 찼으면 True, 아니면 False
+        """
+        return 0 < self.maxsize <= self.queue.size()
+
+    def put(self, x: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        원소 x를 삽입한다. 큐가 가득 차 있으면 자리가 날 때까지 기다린다.
+
+        Args:
+            x (Any): 삽입할 데이터 (비교 연산(<)이 가능해야 함)
+            block (bool): False이면 기다리지 않는다.
+            timeout (float or None): 최대 대기 시간(초). None이면 무한히 기다린다.
+
+        Raises:
+            IndexError: 기다리지 않거나 timeout이 지나도록 큐가 가득 차 있으면 발생
+        """
+        with self.not_full:
+            if self._isFull():
+                if not block or not self.not_full.wait_for(lambda: not self._isFull(), timeout):
+                    raise IndexError("Queue Full")
+
+            self.queue.enqueue(x)
+            self.not_empty.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        가장 작은 원소를 제거하고 반환한다. 큐가 비어있으면 원소가 들어올 때까지 기다린다.
+
+        Args:
+            block (bool): False이면 기다리지 않는다.
+            timeout (float or None): 최대 대기 시간(초). None이면 무한히 기다린다.
+
+        Returns:
+            Any: 제거된 원소
+
+        Raises:
+            IndexError: 기다리지 않거나 timeout이 지나도록 큐가 비어있으면 발생
+        """
+        with self.not_empty:
+            if self.queue.isEmpty():
+                if not block or not self.not_empty.wait_for(lambda: not self.queue.isEmpty(), timeout):
+                    raise IndexError("Queue Empty")
+
+            x = self.queue.dequeue()
+            self.not_full.notify()
+            return x
+
+    def get_many(self, n: int, block: bool = True, timeout: Optional[float] = None) -> List[Any]:
+        """
+        작은 원소부터 최대 n개를 한 번의 락 획득으로 꺼내 리스트로 반환한다.
+
+        큐가 비어있으면 원소가 하나라도 들어올 때까지 기다린 뒤,
+        그 시점에 있는 원소를 최대 n개까지 꺼낸다.
+
+        Args:
+            n (int): 꺼낼 최대 원소 수
+            block (bool): False이면 기다리지 않는다.
+            timeout (float or None): 최대 대기 시간(초). None이면 무한히 기다린다.
+
+        Returns:
+            list: 꺼낸 원소들 (작은 값부터, 1개 이상 n개 이하)
+
+        Raises:
+            IndexError: 기다리지 않거나 timeout이 지나도록 큐가 비어있으면 발생
+        """
+        with self.not_empty:
+            if self.queue.isEmpty():
+                if not block or not self.not_empty.wait_for(lambda: not self.queue.isEmpty(), timeout):
+                    raise IndexError("Queue Empty")
+
+            items = [self.queue.dequeue() for _ in range(min(n, self.queue.size()))]
+            self.not_full.notify(len(items))
+            return items
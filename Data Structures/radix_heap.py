@@ -0,0 +1,161 @@
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+
+class RadixPriorityQueue:
+    def __init__(self, key: Optional[Callable[[Any], int]] = None) -> None:
+        """
+        정수 우선순위가 줄어들지 않는(monotone) 경우에 쓰는 radix 힙 우선순위 큐를 초기화한다.
+
+        다익스트라처럼 꺼낸 우선순위보다 작은 원소를 다시 넣지 않는 작업에서 사용한다.
+        마지막으로 꺼낸 키를 last라 하면, 키 k인 원소는 (k ^ last).bit_length() 번
+        버킷에 들어간다. 0번 버킷에는 k == last인 원소만 있고, 번호가 클수록 last와
+        높은 비트에서 갈라지는 (더 큰) 키가 들어 있다.
+        - enqueue: 버킷 번호를 계산해 끝에 붙인다. O(1)
+        - dequeue: 0번 버킷이 비었으면 비어있지 않은 첫 버킷에서 최솟값을 새 last로 삼고,
+          그 버킷의 원소들을 더 낮은 버킷으로 나눠 담는다. 원소마다 버킷 번호가 줄어들기만
+          하므로 분할 상환 O(log C)이다. (C: 키의 최댓값)
+        원소끼리 비교하지 않으므로 큐에 들어 있는 원소 수와 무관하다.
+
+        같은 키끼리는 먼저 들어온 원소가 먼저 나간다(FIFO).
+
+        Args:
+            key (Callable or None): 원소에서 0 이상의 정수 키를 꺼내는 함수. None이면 원소 자체가 키이다.
+        """
+        self.key: Callable[[Any], int] = key if key is not None else (lambda x: x)
+        self.buckets: List[Deque[Tuple[int, Any]]] = [deque()]
+        self.last: int = 0   # 마지막으로 꺼낸 키 (이보다 작은 키는 넣을 수 없다)
+        self.count: int = 0
+        # peek이 찾아 둔 최소 항목 (k, x)과 그 버킷 번호. 모르면 None이다.
+        self.top: Optional[Tuple[int, Any]] = None
+        self.top_bucket: int = 0
+
+    def size(self) -> int:
+        """
+        우선순위 큐에 들어있는 원소의 개수를 반환한다.
+
+        Returns:
+            int: 큐 원소 개수
+        """
+        return self.count
+
+    def isEmpty(self) -> bool:
+        """
+        우선순위 큐가 비어있는지 여부를 반환한다.
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return self.count == 0
+
+    def _bucketIndex(self, k: int) -> int:
+        """
+        키 k가 들어갈 버킷의 번호를 반환한다. 버킷이 모자라면 늘린다.
+
+        Args:
+            k (int): 키
+
+        Returns:
+            int: 키 k의 버킷 번호
+        """
+        b = (k ^ self.last).bit_length()
+        while len(self.buckets) <= b:
+            self.buckets.append(deque())
+
+        return b
+
+    def enqueue(self, x: Any) -> None:
+        """
+        원소 x를 우선순위 큐에 삽입한다. O(1)
+
+        Args:
+            x (Any): 삽입할 데이터
+
+        Raises:
+            ValueError: x의 키가 마지막으로 꺼낸 키보다 작으면 발생
+        """
+        k = self.key(x)
+        if k < self.last:
+            raise ValueError(f"key {k} is smaller than the last dequeued key {self.last}")
+
+        b = self._bucketIndex(k)
+        self.buckets[b].append((k, x))
+        self.count += 1
+
+        # 버킷 번호가 작을수록 키도 작으므로, 캐시한 최소 항목과 버킷 번호/키만 비교한다.
+        # (키가 같으면 먼저 들어온 원소가 앞이므로 바꾸지 않는다)
+        if self.top is not None:
+            if b < self.top_bucket or (b == self.top_bucket and k < self.top[0]):
+                self.top = (k, x)
+                self.top_bucket = b
+
+    def _firstBucket(self) -> int:
+        """
+        비어있지 않은 첫 번째 버킷의 번호를 반환한다. (큐가 비어있지 않아야 한다)
+
+        Returns:
+            int: 버킷 번호
+        """
+        b = 0
+        while not self.buckets[b]:
+            b += 1
+
+        return b
+
+    def dequeue(self) -> Any:
+        """
+        키가 가장 작은 원소를 제거하고 반환한다. 분할 상환 O(log C)
+
+        Returns:
+            Any: 제거된 원소
+
+        Raises:
+            IndexError: 큐가 비어있으면 발생
+        """
+        if self.isEmpty():
+            raise IndexError("dequeue from empty priority queue")
+
+        if not self.buckets[0]:
+            bucket = self.buckets[self._firstBucket()]
+            self.last = self.top[0] if self.top is not None else min(k for k, _ in bucket)
+
+            # 새 last 기준으로는 모두 더 낮은 버킷에 속한다. (순서는 그대로 유지)
+            while bucket:
+                k, x = bucket.popleft()
+                self.buckets[self._bucketIndex(k)].append((k, x))
+
+        self.top = None
+        self.count -= 1
+        return self.buckets[0].popleft()[1]
+
+    def peek(self) -> Any:
+        """
+        dequeue 대상 원소(키가 가장 작은 원소)를 제거하지 않고 반환한다.
+
+        last를 바꾸면 그 사이 키를 가진 원소를 더 이상 넣을 수 없으므로
+        버킷을 다시 나누지 않고, 0번 버킷이 비었으면 첫 버킷에서 최솟값을 찾는다.
+        찾은 항목은 다음 dequeue까지 캐시하고 enqueue 때 함께 갱신하므로,
+        연속된 peek은 O(1)이다.
+
+        Returns:
+            Any: dequeue 대상 원소
+
+        Raises:
+            IndexError: 큐가 비어있으면 발생
+        """
+        if self.isEmpty():
+            raise IndexError("peek from empty priority queue")
+
+        if self.top is None:
+            b = self._firstBucket()
+            bucket = self.buckets[b]
+            best = bucket[0]
+            if b > 0:  # 0번 버킷의 키는 모두 last로 같다.
+                for entry in bucket:
+                    if entry[0] < best[0]:
+                        best = entry
+
+            self.top = best
+            self.top_bucket = b
+
+        return self.top[1]
@@ -0,0 +1,258 @@
+import math
+from typing import Any, List, Optional
+from doubly_linkedlist import Node, DoublyLinkedList
+
+
+class Timer:
+    def __init__(self, expires: int, item: Any):
+        """
+        타이머 휠에 등록된 타이머 하나를 초기화한다.
+
+        Args:
+            expires (int): 만료될 틱 번호
+            item (Any): 만료 시 돌려줄 데이터
+        """
+        self.expires = expires
+        self.item = item
+        self.node = Node(self)
+        self.slot: Optional[DoublyLinkedList] = None  # 현재 들어 있는 슬롯
+        self.level: int = 0                            # 현재 들어 있는 슬롯의 레벨
+
+
+class TimerWheel:
+    def __init__(self, tick: float = 1.0, wheel_size: int = 256, levels: int = 4, start: float = 0.0):
+        """
+        계층형 타이밍 휠(hierarchical timing wheel)을 초기화한다.
+
+        시간을 tick 단위로 나누고, 레벨 l의 휠은 슬롯 하나가 wheel_size**l 틱을
+        담당하는 wheel_size개의 슬롯으로 이루어진다. 각 슬롯은 양방향 연결
+        리스트(DoublyLinkedList)이다.
+        - schedule: 만료 시각이 속한 레벨/슬롯을 계산해 리스트 끝에 붙인다. O(1)
+        - cancel: 타이머가 기억하는 노드를 리스트에서 떼어낸다. O(1)
+        - advance: 틱을 하나씩 진행하며 레벨 0 슬롯을 통째로 만료시키고,
+          상위 레벨 슬롯의 차례가 오면 그 타이머들을 아래 레벨로 옮긴다(cascade).
+          아래 레벨들이 비어 있으면 다음 cascade 틱까지 건너뛴다.
+        정렬 구조가 아니므로 대기 중인 타이머 수와 무관하게 타이머당 비용이 일정하다.
+
+        wheel_size**levels 틱보다 먼 타이머는 최상위 레벨의 가장 나중 슬롯에 두었다가
+        차례가 오면 다시 자리를 계산한다.
+
+        Args:
+            tick (float): 틱 하나의 시간 길이 (0 초과)
+            wheel_size (int): 레벨당 슬롯 수 (2 이상)
+            levels (int): 레벨 수 (1 이상)
+            start (float): 휠의 시작 시각
+
+        Raises:
+            ValueError: 인자가 범위를 벗어나면 발생
+        """
+        if tick <= 0 or wheel_size < 2 or levels < 1:
+            raise ValueError("invalid timer wheel configuration")
+
+        self.tick: float = tick
+        self.wheel_size: int = wheel_size
+        self.levels: int = levels
+        self.wheels: List[List[DoublyLinkedList]] = [
+            [DoublyLinkedList() for _ in range(wheel_size)] for _ in range(levels)
+        ]
+        self.time: float = start                      # 마지막으로 진행한 시각
+        self.current: int = math.floor(start / tick)  # 이미 처리한 마지막 틱
+        self.count: int = 0
+        self.counts: List[int] = [0] * levels         # 레벨별 대기 중인 타이머 수
+
+    def size(self) -> int:
+        """
+        대기 중인 타이머 수를 반환한다.
+
+        Returns:
+            int: 대기 중인 타이머 수
+        """
+        return self.count
+
+    def isEmpty(self) -> bool:
+        """
+        대기 중인 타이머가 없는지 여부를 반환한다.
+
+        Returns:
+            bool: 없으면 True, 아니면 False
+        """
+        return self.count == 0
+
+    def now(self) -> float:
+        """
+        휠이 지금까지 진행한 시각(마지막으로 advance에 넘긴 시각)을 반환한다.
+
+        Returns:
+            float: 현재 시각
+        """
+        return self.time
+
+    def _place(self, timer: Timer) -> None:
+        """
+        타이머의 남은 틱 수에 맞는 레벨/슬롯을 계산해 그 슬롯의 끝에 붙인다.
+
+        Args:
+            timer (Timer): 붙일 타이머
+        """
+        ws = self.wheel_size
+        diff = timer.expires - self.current
+        span = 1  # 레벨 l의 슬롯 하나가 담당하는 틱 수 (ws ** l)
+
+        for level in range(self.levels):
+            if diff < span * ws:
+                index = (timer.expires // span) % ws
+                break
+            if level < self.levels - 1:
+                span *= ws
+        else:
+            # 휠 전체 범위를 넘는 타이머: 최상위 레벨에서 가장 나중에 돌아오는 슬롯
+            level = self.levels - 1
+            index = (self.current // span + ws - 1) % ws
+
+        slot = self.wheels[level][index]
+        slot.insertBefore(slot.tail, timer.node)
+        timer.slot = slot
+        timer.level = level
+        self.counts[level] += 1
+
+    def schedule(self, delay: float, item: Any) -> Timer:
+        """
+        delay 시간 뒤에 만료되는 타이머를 등록한다. O(1)
+
+        만료 틱은 (now() + delay)를 올림한 틱이므로, 타이머는 now() + delay 이상인
+        시각으로 advance를 호출해야 만료된다. (delay보다 먼저 만료되지 않는다)
+
+        Args:
+            delay (float): 현재 시각(now())으로부터의 지연 시간
+            item (Any): 만료 시 돌려줄 데이터
+
+        Returns:
+            Timer: cancel에 사용할 타이머
+        """
+        expires = max(self.current + 1, math.ceil((self.time + delay) / self.tick))
+        timer = Timer(expires, item)
+        self._place(timer)
+        self.count += 1
+        return timer
+
+    def cancel(self, timer: Timer) -> bool:
+        """
+        타이머를 취소한다. O(1)
+
+        Args:
+            timer (Timer): schedule이 반환한 타이머
+
+        Returns:
+            bool: 취소했으면 True, 이미 만료되었거나 취소된 타이머이면 False
+        """
+        slot = timer.slot
+        if slot is None or timer.node.prev is None:
+            return False
+
+        slot.popAfter(timer.node.prev)
+        timer.slot = None
+        self.counts[timer.level] -= 1
+        self.count -= 1
+        return True
+
+    def advance(self, now: float) -> List[Any]:
+        """
+        휠을 시각 now까지 진행하고, 그동안 만료된 타이머들의 데이터를 한 번에 반환한다.
+
+        가장 낮은 레벨부터 비어 있는 레벨이 이어지는 동안은 아무 일도 일어나지 않으므로,
+        그 위 레벨의 다음 cascade 틱까지 한 번에 건너뛴다. 따라서 먼 타이머 하나만
+        있을 때도 반복 횟수는 틱 수가 아니라 cascade 횟수에 비례한다.
+        (레벨이 하나뿐이면 건너뛸 상위 레벨이 없으므로 틱마다 진행한다)
+
+        Args:
+            now (float): 진행할 시각 (이전 시각보다 작으면 아무 일도 하지 않는다)
+
+        Returns:
+            list: 만료된 타이머들의 데이터 (만료 틱 순서)
+        """
+        if now <= self.time:
+            return []
+
+        self.time = now
+        target = math.floor(now / self.tick)
+        expired: List[Any] = []
+        ws = self.wheel_size
+
+        while self.current < target:
+            if self.count == 0:
+                # 대기 중인 타이머가 없으면 빈 틱을 돌 필요가 없다.
+                self.current = target
+                break
+
+            # 아래 레벨들이 비어 있으면 다음 cascade 틱 직전까지 건너뛴다.
+            span = 1
+            for level in range(self.levels - 1):
+                if self.counts[level]:
+                    break
+                span *= ws
+
+            if span > 1:
+                boundary = (self.current // span + 1) * span
+                if boundary > target:
+                    self.current = target
+                    break
+                self.current = boundary - 1
+
+            self.current += 1
+
+            # 이번 틱에서 차례가 된 상위 레벨 슬롯을 위에서부터 아래로 내린다.
+            # (레벨 l의 슬롯은 current가 ws**l의 배수가 될 때 차례가 온다.)
+            spans = [1]
+            while len(spans) < self.levels and self.current % (spans[-1] * ws) == 0:
+                spans.append(spans[-1] * ws)
+
+            for level in range(len(spans) - 1, 0, -1):
+                index = (self.current // spans[level]) % ws
+                self._cascade(self.wheels[level][index], level)
+
+            expired.extend(self._drain(self.wheels[0][self.current % ws]))
+
+        return expired
+
+    def _cascade(self, slot: DoublyLinkedList, level: int) -> None:
+        """
+        슬롯의 타이머들을 떼어내 남은 틱 수에 맞는 (더 낮은) 레벨로 다시 배치한다.
+
+        Args:
+            slot (DoublyLinkedList): 비울 슬롯
+            level (int): 슬롯의 레벨
+        """
+        while slot.getLength() > 0:
+            timer = slot.popAfter(slot.head)
+            assert timer is not None  # 길이가 0보다 크므로 None일 수 없다.
+            self.counts[level] -= 1
+            self._place(timer)
+
+    def _drain(self, slot: DoublyLinkedList) -> List[Any]:
+        """
+        레벨 0 슬롯의 타이머들을 모두 만료시키고 데이터를 반환한다.
+
+        레벨이 하나뿐이면 휠 범위를 넘는 타이머도 레벨 0 슬롯에 있으므로,
+        아직 만료되지 않은 타이머는 다시 배치한다.
+
+        Args:
+            slot (DoublyLinkedList): 비울 슬롯
+
+        Returns:
+            list: 만료된 타이머들의 데이터
+        """
+        items: List[Any] = []
+
+        while slot.getLength() > 0:
+            timer = slot.popAfter(slot.head)
+            assert timer is not None  # 길이가 0보다 크므로 None일 수 없다.
+            self.counts[0] -= 1
+            if timer.expires > self.current:
+                self._place(timer)
+                continue
+
+            timer.slot = None
+            self.count -= 1
+            items.append(timer.item)
+
+        return items
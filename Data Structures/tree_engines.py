@@ -0,0 +1,83 @@
+import tracemalloc
+from typing import Dict, List, Optional, Union
+
+from array_binary_tree import ArrayBinaryTree
+from binary_tree import BalancedBinaryTree, BinaryTree, Node
+
+
+Tree = Union[BinaryTree, ArrayBinaryTree]
+
+# 노드 기반 트리의 노드당 크기를 잴 때 만들어 보는 표본 노드 수
+NODE_SAMPLE: int = 1024
+
+# 설정 값(문자열)으로 트리 구현을 고를 수 있도록 이름과 클래스를 묶어 둔다.
+TREE_ENGINES: Dict[str, type] = {
+    "node": BinaryTree,
+    "balanced": BalancedBinaryTree,
+    "array": ArrayBinaryTree,
+}
+
+
+def create_tree(engine: str = "node") -> Tree:
+    """
+    설정 이름에 해당하는 구현으로 빈 트리를 만든다.
+
+    Args:
+        engine (str): TREE_ENGINES의 키 ("node", "balanced", "array")
+
+    Returns:
+        BinaryTree or ArrayBinaryTree: 빈 트리
+
+    Raises:
+        ValueError: 알 수 없는 engine 이름이면 발생
+    """
+    if engine not in TREE_ENGINES:
+        raise ValueError(f"unknown tree engine: {engine!r}")
+
+    return TREE_ENGINES[engine]()
+
+
+def bytes_per_node(tree: Tree) -> float:
+    """
+    트리 구조가 노드 하나당 차지하는 평균 바이트 수를 반환한다.
+
+    키/데이터 객체 자체의 크기는 제외하고, 노드 표현에 드는 비용만 센다.
+    - 노드 기반 트리: 같은 클래스의 노드 NODE_SAMPLE개를 만들어 tracemalloc으로 잰
+      실제 할당량의 평균. 트리 크기와 무관하게 표본만 만들며 트리는 건드리지 않는다.
+      (Python 3.11+에서 속성은 객체 안에 저장되므로 node.__dict__를 읽으면
+      측정 자체가 dict를 만들어 크기를 부풀린다)
+    - 배열 기반 트리: 병렬 배열/리스트 전체의 크기 (빈 슬롯 포함)
+
+    Args:
+        tree (BinaryTree or ArrayBinaryTree): 측정할 트리
+
+    Returns:
+        float: 노드당 바이트 수, 빈 트리는 0.0
+    """
+    n = tree.size()
+    if n == 0:
+        return 0.0
+
+    if isinstance(tree, ArrayBinaryTree):
+        return tree.nbytes() / n
+
+    node_class = type(tree.root) if tree.root else Node
+    sample: List[Optional[Node]] = [None] * NODE_SAMPLE  # 표본을 담을 리스트는 미리 만든다.
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        prev = None
+        for i in range(NODE_SAMPLE):
+            node = node_class(None, None)
+            node.left = prev  # 트리처럼 자식 링크도 채운다.
+            sample[i] = prev = node
+        total = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return total / NODE_SAMPLE
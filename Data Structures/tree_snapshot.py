@@ -0,0 +1,361 @@
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from collections import deque
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
+
+
+# 파일 구조
+#   [헤더][키/데이터 힙][노드 테이블]
+#   - 헤더: 매직 바이트, 노드 수, 루트 번호, 깊이, 노드 테이블 시작 위치
+#   - 힙: 각 노드의 키와 데이터를 pickle한 바이트열을 이어 붙인 영역
+#   - 노드 테이블: 노드마다 고정 크기 레코드
+#       (왼쪽 자식 번호, 오른쪽 자식 번호, 키 위치, 키 길이, 데이터 위치, 데이터 길이)
+MAGIC = b"BTSNAP01"
+HEADER = struct.Struct("<8sqqqq")
+RECORD = struct.Struct("<qqqqqq")
+NIL = -1
+
+
+def _umask() -> int:
+    """
+    현재 프로세스의 umask를 반환한다. (os.umask는 설정과 동시에만 읽을 수 있다)
+
+    Returns:
+        int: umask 값
+    """
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def save(root, depth: int, path: str) -> None:
+    """
+    노드 기반 이진 탐색 트리를 메모리 매핑 가능한 단일 파일로 저장한다.
+
+    Args:
+        root (Node or None): 저장할 트리의 루트 (key, data, left, right를 가진 노드)
+        depth (int): 트리의 깊이 (헤더에 기록)
+        path (str): 저장할 파일 경로
+    """
+    _write(path, depth, root, None, lambda node: (node.key, node.data, node.left, node.right))
+
+
+def save_array(tree, path: str) -> None:
+    """
+    배열 기반 이진 탐색 트리(ArrayBinaryTree)를 save와 같은 형식의 파일로 저장한다.
+
+    슬롯 번호를 그대로 따라가므로 노드 객체를 새로 만들지 않는다.
+
+    Args:
+        tree (ArrayBinaryTree): 저장할 트리
+        path (str): 저장할 파일 경로
+    """
+    def expand(i: int) -> Tuple[Any, Any, int, int]:
+        return tree.keys[i], tree.data[i], tree.left[i], tree.right[i]
+
+    _write(path, tree.depth(), tree.root, NIL, expand)
+
+
+def _write(path: str, depth: int, root: Any, nil: Any,
+           expand: Callable[[Any], Tuple[Any, Any, Any, Any]]) -> None:
+    """
+    트리를 스냅샷 파일로 쓴다. 트리 표현(노드/배열)은 root, nil, expand로 추상화한다.
+
+    노드는 레벨 순서로 번호를 매기므로, 부모를 기록하는 시점에 자식 번호를
+    이미 알 수 있어 한 번의 순회로 파일을 쓸 수 있다.
+
+    같은 디렉터리의 임시 파일에 끝까지 쓰고 fsync한 뒤 os.replace로 path에 바꿔 단다.
+    기존 파일을 제자리에서 덮어쓰지 않으므로, 이미 MappedBinaryTree로 열려 있는
+    매핑은 이전 파일(inode)을 계속 읽는다. 새 파일의 권한은 기존 파일과 같게,
+    기존 파일이 없으면 umask를 적용한 0666으로 둔다.
+
+    Args:
+        path (str): 저장할 파일 경로
+        depth (int): 트리의 깊이 (헤더에 기록)
+        root (Any): 루트 노드 (트리 표현에서의 노드 참조)
+        nil (Any): 자식이 없음을 나타내는 값 (노드 기반은 None, 배열 기반은 NIL)
+        expand (Callable): 노드 참조를 (key, data, 왼쪽 자식, 오른쪽 자식)으로 바꾸는 함수
+    """
+    table = bytearray()
+    count = 0
+
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        # mkstemp은 0600으로 만들므로, 기존 파일의 권한을 따르거나 open()처럼 umask를 적용한다.
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_umask()
+        os.fchmod(fd, mode)
+
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, 0, NIL, 0, 0))
+            offset = HEADER.size
+
+            queue: Deque = deque([root] if root is not nil else [])
+            next_index = 1
+
+            while queue:
+                key, data, left_child, right_child = expand(queue.popleft())
+                key_blob = pickle.dumps(key)
+                data_blob = pickle.dumps(data)
+
+                left = right = NIL
+                if left_child is not nil:
+                    left = next_index
+                    next_index += 1
+                    queue.append(left_child)
+                if right_child is not nil:
+                    right = next_index
+                    next_index += 1
+                    queue.append(right_child)
+
+                table += RECORD.pack(
+                    left, right,
+                    offset, len(key_blob),
+                    offset + len(key_blob), len(data_blob),
+                )
+                f.write(key_blob)
+                f.write(data_blob)
+                offset += len(key_blob) + len(data_blob)
+                count += 1
+
+            f.write(table)
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, count, 0 if count else NIL, depth, offset))
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class MappedBinaryTree:
+    def __init__(self, path: str):
+        """
+        save로 저장한 파일을 메모리 매핑하여 읽기 전용 트리로 연다.
+
+        파일 전체를 읽어 노드를 다시 만들지 않고, 탐색/순회가 실제로 지나가는
+        노드의 레코드와 키만 그때그때 디코딩한다. 따라서 여는 비용은 파일 크기와
+        무관하며, 같은 파일을 여는 여러 프로세스는 OS 페이지 캐시를 공유한다.
+
+        주의: 키/데이터는 pickle로 저장되므로 신뢰할 수 있는 파일만 열어야 한다.
+
+        Args:
+            path (str): save로 저장한 파일 경로
+
+        Raises:
+            ValueError: 스냅샷 파일 형식이 아니면 발생
+        """
+        with open(path, "rb") as f:
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, root, depth, table = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC:
+            self.buf.close()
+            raise ValueError(f"not a tree snapshot: {path!r}")
+
+        self.count: int = count
+        self.root: int = root
+        self.height: int = depth
+        self.table: int = table
+
+    def close(self) -> None:
+        """
+        메모리 매핑을 해제한다.
+        """
+        self.buf.close()
+
+    def __enter__(self) -> "MappedBinaryTree":
+        """
+        with 문에서 사용할 수 있도록 자기 자신을 반환한다.
+        """
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        with 블록을 벗어나면 메모리 매핑을 해제한다.
+        """
+        self.close()
+
+    def _record(self, i: int) -> Tuple[int, int, int, int, int, int]:
+        """
+        i번 노드의 레코드를 디코딩한다.
+
+        Args:
+            i (int): 노드 번호
+
+        Returns:
+            tuple: (왼쪽, 오른쪽, 키 위치, 키 길이, 데이터 위치, 데이터 길이)
+        """
+        return RECORD.unpack_from(self.buf, self.table + i * RECORD.size)
+
+    def _load(self, offset: int, length: int) -> Any:
+        """
+        힙의 [offset, offset + length) 구간을 unpickle한다.
+
+        Args:
+            offset (int): 시작 위치
+            length (int): 길이
+
+        Returns:
+            Any: 복원된 객체
+        """
+        return pickle.loads(self.buf[offset:offset + length])
+
+    def size(self) -> int:
+        """
+        트리의 전체 노드 개수를 반환한다.
+
+        Returns:
+            int: 트리의 노드 수
+        """
+        return self.count
+
+    def depth(self) -> int:
+        """
+        트리의 깊이(높이)를 반환한다.
+
+        Returns:
+            int: 트리의 깊이
+        """
+        return self.height
+
+    def get(self, key) -> Optional[Any]:
+        """
+        key에 대응되는 데이터를 반환한다. 지나가는 노드의 키만 디코딩한다.
+
+        Args:
+            key (Any): 찾을 키
+
+        Returns:
+            Any or None: key에 대응되는 데이터, key가 없으면 None
+        """
+        i = self.root
+
+        while i != NIL:
+            left, right, key_off, key_len, data_off, data_len = self._record(i)
+            k = self._load(key_off, key_len)
+
+            if key < k:
+                i = left
+            elif key > k:
+                i = right
+            else:
+                return self._load(data_off, data_len)
+
+        return None
+
+    def floor(self, key) -> Optional[Any]:
+        """
+        key 이하인 키 중 가장 큰 키를 반환한다.
+
+        Args:
+            key (Any): 기준 키
+
+        Returns:
+            Any or None: key 이하의 최대 키, 없으면 None
+        """
+        result = None
+        i = self.root
+
+        while i != NIL:
+            left, right, key_off, key_len, _, _ = self._record(i)
+            k = self._load(key_off, key_len)
+
+            if key < k:
+                i = left
+            elif key > k:
+                result = k
+                i = right
+            else:
+                return k
+
+        return result
+
+    def ceiling(self, key) -> Optional[Any]:
+        """
+        key 이상인 키 중 가장 작은 키를 반환한다.
+
+        Args:
+            key (Any): 기준 키
+
+        Returns:
+            Any or None: key 이상의 최소 키, 없으면 None
+        """
+        result = None
+        i = self.root
+
+        while i != NIL:
+            left, right, key_off, key_len, _, _ = self._record(i)
+            k = self._load(key_off, key_len)
+
+            if key > k:
+                i = right
+            elif key < k:
+                result = k
+                i = left
+            else:
+                return k
+
+        return result
+
+    def range(self, lo=None, hi=None) -> Iterator[Tuple[Any, Any]]:
+        """
+        lo <= key < hi 를 만족하는 (key, data) 쌍을 키 순서대로 내보낸다.
+
+        Args:
+            lo (Any or None): 하한(포함). None이면 하한이 없다.
+            hi (Any or None): 상한(미포함). None이면 상한이 없다.
+
+        Yields:
+            tuple: (key, data)
+        """
+        # 스택에는 (오른쪽 자식 번호, 키, 데이터 위치, 데이터 길이)를 쌓는다.
+        stack: List[Tuple[int, Any, int, int]] = []
+        i = self.root
+
+        while stack or i != NIL:
+            while i != NIL:
+                left, right, key_off, key_len, data_off, data_len = self._record(i)
+                k = self._load(key_off, key_len)
+
+                if lo is not None and k < lo:
+                    i = right
+                else:
+                    stack.append((right, k, data_off, data_len))
+                    i = left
+
+            if not stack:
+                return
+
+            right, k, data_off, data_len = stack.pop()
+            if hi is not None and not (k < hi):
+                return
+
+            yield k, self._load(data_off, data_len)
+            i = right
+
+    def iter_inorder(self) -> Iterator[Any]:
+        """
+        트리를 중위 순회하며 노드 데이터를 하나씩 내보낸다.
+
+        Yields:
+            Any: 중위 순회 순서의 노드 데이터
+        """
+        for _, data in self.range():
+            yield data
+
+    def inorder(self) -> List[Any]:
+        """
+        트리의 중위 순회 결과를 리스트로 반환한다.
+
+        Returns:
+            list: 중위 순회 결과(노드 데이터의 리스트)
+        """
+        return list(self.iter_inorder())